@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_runs
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -65,6 +66,10 @@ from homeassistant.helpers.deprecation import (
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
+from homeassistant.helpers.reference_index import (
+    async_get_referencing_entity_ids,
+    async_track_entity_references,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -132,6 +137,8 @@ ATTR_SOURCE = "source"
 ATTR_VARIABLES = "variables"
 SERVICE_TRIGGER = "trigger"
 
+DATA_REFERENCES = "automation_references"
+
 
 class IfAction(Protocol):
     """Define the format of if_action."""
@@ -174,11 +181,9 @@ def _automations_with_x(
 
     component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
 
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if referenced_id in getattr(automation_entity, property_name)
-    ]
+    return async_get_referencing_entity_ids(
+        hass, DATA_REFERENCES, component.entities, property_name, referenced_id
+    )
 
 
 def _x_in_automation(
@@ -235,16 +240,7 @@ def areas_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all automations that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if automation_entity.referenced_blueprint == blueprint_path
-    ]
+    return _automations_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -360,6 +356,11 @@ class BaseAutomationEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Drop the index of referenced ids when the automation is added or removed."""
+        await super().async_internal_added_to_hass()
+        async_track_entity_references(self.hass, DATA_REFERENCES, self)
+
     @abstractmethod
     async def async_trigger(
         self,
@@ -700,6 +701,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self.async_disable()
+        async_remove_trace_runs(self.hass, DOMAIN, self.unique_id)
 
     async def _async_enable_automation(self, event: Event) -> None:
         """Start automation on startup."""
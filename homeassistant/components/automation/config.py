@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Mapping
 from contextlib import suppress
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
@@ -25,6 +26,7 @@ from homeassistant.helpers import config_validation as cv, script
 from homeassistant.helpers.condition import async_validate_conditions_config
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.validated_config import ValidatedConfigCache
 from homeassistant.util.yaml.input import UndefinedSubstitution
 
 from .const import (
@@ -255,18 +257,36 @@ async def async_validate_config_item(
 
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
     """Validate config."""
+    # Automations which are unchanged since the previous validation are not
+    # validated again. Blueprint automations are always validated since the
+    # blueprint may have changed.
+    validated_configs: ValidatedConfigCache[AutomationConfig] = ValidatedConfigCache(
+        hass, DOMAIN
+    )
+
+    async def _async_validate_or_reuse_config_item(
+        config: ConfigType,
+    ) -> AutomationConfig | None:
+        if blueprint.is_blueprint_instance_config(config):
+            return await _try_async_validate_config_item(hass, config)
+        return await validated_configs.async_get_or_validate(
+            config, partial(_try_async_validate_config_item, hass, config)
+        )
+
     automations = list(
         filter(
             lambda x: x is not None,
             await asyncio.gather(
                 *(
-                    _try_async_validate_config_item(hass, p_config)
+                    _async_validate_or_reuse_config_item(p_config)
                     for _, p_config in config_per_platform(config, DOMAIN)
                 )
             ),
         )
     )
 
+    validated_configs.async_store()
+
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
     config = config_without_domain(config, DOMAIN)
@@ -5,6 +5,7 @@ from collections.abc import Callable, Iterable
 from functools import partial
 import itertools
 import logging
+from typing import Any
 
 from bleak_retry_connector import BleakSlotManager
 from bluetooth_adapters import BluetoothAdapters
@@ -118,6 +119,17 @@ class HomeAssistantBluetoothManager(BluetoothManager):
                 service_info,
             )
 
+    async def async_diagnostics(self) -> dict[str, Any]:
+        """Diagnostics for the manager."""
+        callback_index = self._callback_index
+        return {
+            **await super().async_diagnostics(),
+            "callback_match_cache": {
+                "hits": callback_index.cache_hits,
+                "misses": callback_index.cache_misses,
+            },
+        }
+
     def _address_disappeared(self, address: str) -> None:
         """Dismiss all discoveries for the given address."""
         self._integration_matcher.async_clear_address(address)
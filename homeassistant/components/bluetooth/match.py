@@ -19,6 +19,7 @@ if TYPE_CHECKING:
 
 
 MAX_REMEMBER_ADDRESSES: Final = 2048
+MAX_CALLBACK_MATCH_CACHE: Final = 4096
 
 CALLBACK: Final = "callback"
 DOMAIN: Final = "domain"
@@ -297,13 +298,28 @@ class BluetoothCallbackMatcherIndex(
     Supports matching on addresses.
     """
 
-    __slots__ = ("address", "connectable")
+    __slots__ = (
+        "address",
+        "connectable",
+        "manufacturer_data_start_ids",
+        "match_cache",
+        "cache_hits",
+        "cache_misses",
+    )
 
     def __init__(self) -> None:
         """Initialize the matcher index."""
         super().__init__()
         self.address: dict[str, list[BluetoothCallbackMatcherWithCallback]] = {}
         self.connectable: list[BluetoothCallbackMatcherWithCallback] = []
+        self.manufacturer_data_start_ids: set[int] = set()
+        # Some devices use a random address so we need to use
+        # an LRU to avoid memory issues.
+        self.match_cache: LRU[tuple, list[BluetoothCallbackMatcherWithCallback]] = LRU(
+            MAX_CALLBACK_MATCH_CACHE
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def add_callback_matcher(
         self, matcher: BluetoothCallbackMatcherWithCallback
@@ -314,6 +330,10 @@ class BluetoothCallbackMatcherIndex(
 
         We put them in the bucket that they are most likely to match.
         """
+        self.match_cache.clear()
+        if MANUFACTURER_DATA_START in matcher and MANUFACTURER_ID in matcher:
+            self.manufacturer_data_start_ids.add(matcher[MANUFACTURER_ID])
+
         if ADDRESS in matcher:
             self.address.setdefault(matcher[ADDRESS], []).append(matcher)
             return
@@ -334,6 +354,8 @@ class BluetoothCallbackMatcherIndex(
         Matchers only end up in one bucket, so once we have
         removed one, we are done.
         """
+        self.match_cache.clear()
+
         if ADDRESS in matcher:
             self.address[matcher[ADDRESS]].remove(matcher)
             return
@@ -349,7 +371,37 @@ class BluetoothCallbackMatcherIndex(
     def match_callbacks(
         self, service_info: BluetoothServiceInfoBleak
     ) -> list[BluetoothCallbackMatcherWithCallback]:
-        """Check for a match."""
+        """Check for a match.
+
+        Besides the manufacturer data start, the matchers only look at the
+        keys of the service data and the manufacturer data, so the result is
+        cached for the shape of the advertisement. Devices that send a
+        changing payload, like a counter or a sensor reading, are only
+        matched once.
+        """
+        manufacturer_data = service_info.manufacturer_data
+        key = (
+            service_info.address,
+            service_info.connectable,
+            service_info.name,
+            tuple(manufacturer_data.items())
+            if self.manufacturer_data_start_ids
+            and not self.manufacturer_data_start_ids.isdisjoint(manufacturer_data)
+            else tuple(manufacturer_data),
+            tuple(service_info.service_data),
+            tuple(service_info.service_uuids),
+        )
+        if (matches := self.match_cache.get(key)) is not None:
+            self.cache_hits += 1
+            return matches
+        self.cache_misses += 1
+        self.match_cache[key] = matches = self._match_callbacks(service_info)
+        return matches
+
+    def _match_callbacks(
+        self, service_info: BluetoothServiceInfoBleak
+    ) -> list[BluetoothCallbackMatcherWithCallback]:
+        """Check for a match without the cache."""
         matches = self.match(service_info)
         for matcher in self.address.get(service_info.address, []):
             if ble_device_matches(matcher, service_info):
@@ -83,6 +83,7 @@ from .const import (  # noqa: F401
 )
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
+from .shared_image import SharedImageRequests
 
 if TYPE_CHECKING:
     from functools import cached_property
@@ -475,6 +476,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "is_streaming",
     "model",
     "motion_detection_enabled",
+    "snapshot_max_age",
     "supported_features",
 }
 
@@ -496,6 +498,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_model: str | None = None
     _attr_motion_detection_enabled: bool = False
     _attr_should_poll: bool = False  # No need to poll cameras
+    _attr_snapshot_max_age: float = 0
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: CameraEntityFeature = CameraEntityFeature(0)
 
@@ -509,6 +512,10 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        # Snapshots served by the image proxy, keyed by requested width and height
+        self._proxy_images: SharedImageRequests[
+            tuple[int | None, int | None], Image
+        ] | None = None
 
     @property
     def entity_picture(self) -> str:
@@ -570,6 +577,15 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @cached_property
+    def snapshot_max_age(self) -> float:
+        """Return for how many seconds snapshots are reused by the image proxy.
+
+        The default of 0 fetches a new snapshot for every request which does
+        not share a fetch with a concurrent request.
+        """
+        return self._attr_snapshot_max_age
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -655,6 +671,24 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
             partial(self.camera_image, width=width, height=height)
         )
 
+    @final
+    async def async_get_proxy_image(
+        self, timeout: int, width: int | None, height: int | None
+    ) -> Image:
+        """Fetch a snapshot image for the image proxy.
+
+        Concurrent requests for the same size share a single fetch, and the image
+        is reused for requests within the snapshot max age of the camera.
+        """
+        if self._proxy_images is None:
+            self._proxy_images = SharedImageRequests(self.hass)
+        return await self._proxy_images.async_get(
+            (width, height),
+            self.snapshot_max_age,
+            partial(_async_get_image, self, timeout, width, height),
+            f"camera proxy image {self.entity_id}",
+        )
+
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
@@ -828,8 +862,7 @@ class CameraImageView(CameraView):
         width = request.query.get("width")
         height = request.query.get("height")
         try:
-            image = await _async_get_image(
-                camera,
+            image = await camera.async_get_proxy_image(
                 CAMERA_IMAGE_TIMEOUT,
                 int(width) if width else None,
                 int(height) if height else None,
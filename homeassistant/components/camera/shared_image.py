@@ -0,0 +1,73 @@
+"""Share camera image fetches between concurrent requests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+import time
+from typing import Any, Generic, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+_ImageT = TypeVar("_ImageT")
+
+
+class SharedImageRequests(Generic[_KeyT, _ImageT]):
+    """Share image fetches between requests for the same key.
+
+    Concurrent requests for a key share a single fetch, and the fetched image
+    is reused for requests within the max age passed by the caller. Images
+    older than the max age are dropped when a new image is stored.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared requests."""
+        self._hass = hass
+        self._requests: dict[_KeyT, asyncio.Task[_ImageT]] = {}
+        self._images: dict[_KeyT, tuple[float, _ImageT]] = {}
+
+    async def async_get(
+        self,
+        key: _KeyT,
+        max_age: float,
+        fetch: Callable[[], Coroutine[Any, Any, _ImageT]],
+        name: str,
+    ) -> _ImageT:
+        """Return a fresh image for the key or fetch it.
+
+        The shared fetch is shielded, one request going away does not
+        cancel it for the other requests.
+        """
+        if (stored := self._images.get(key)) and time.monotonic() < stored[0]:
+            return stored[1]
+
+        if (request := self._requests.get(key)) is None:
+            request = self._hass.async_create_task(fetch(), name)
+            self._requests[key] = request
+
+            @callback
+            def _async_request_done(request: asyncio.Task[_ImageT]) -> None:
+                """Store the fetched image."""
+                del self._requests[key]
+                if request.cancelled() or request.exception() or max_age <= 0:
+                    self._images.pop(key, None)
+                    return
+                now = time.monotonic()
+                self._async_drop_expired(now)
+                self._images[key] = (now + max_age, request.result())
+
+            request.add_done_callback(_async_request_done)
+
+        return await asyncio.shield(request)
+
+    @callback
+    def _async_drop_expired(self, now: float) -> None:
+        """Drop the images which are older than their max age."""
+        for key, (expires, _) in list(self._images.items()):
+            if now >= expires:
+                del self._images[key]
+
+    @callback
+    def async_remove(self, key: _KeyT) -> None:
+        """Drop the image of a key."""
+        self._images.pop(key, None)
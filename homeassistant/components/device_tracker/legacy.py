@@ -549,6 +549,7 @@ class DeviceTracker:
         )
         self.defaults = defaults
         self._is_updating = asyncio.Lock()
+        self._new_config_devices: list[Device] = []
 
         for dev in devices:
             if self.devices[dev.dev_id] is not dev:
@@ -620,17 +621,21 @@ class DeviceTracker:
             device = self.devices.get(dev_id)
 
         if device is not None:
-            await device.async_seen(
-                host_name,
-                location_name,
-                gps,
-                gps_accuracy,
-                battery,
-                attributes,
-                source_type,
-                consider_home,
-            )
-            if device.track:
+            # Scanners report every device on each scan, only write
+            # the state of the devices that changed
+            if (
+                await device.async_seen(
+                    host_name,
+                    location_name,
+                    gps,
+                    gps_accuracy,
+                    battery,
+                    attributes,
+                    source_type,
+                    consider_home,
+                )
+                and device.track
+            ):
                 device.async_write_ha_state()
             return
 
@@ -692,12 +697,21 @@ class DeviceTracker:
     async def async_update_config(self, path: str, dev_id: str, device: Device) -> None:
         """Add device to YAML configuration file.
 
+        The device is queued and written by the call which is already writing,
+        so this can return before the device is written to the file.
+
         This method is a coroutine.
         """
+        self._new_config_devices.append(device)
+        # The running write picks up the devices added while it writes
+        if self._is_updating.locked():
+            return
         async with self._is_updating:
-            await self.hass.async_add_executor_job(
-                update_config, self.hass.config.path(YAML_DEVICES), dev_id, device
-            )
+            while devices := self._new_config_devices:
+                self._new_config_devices = []
+                await self.hass.async_add_executor_job(
+                    update_config_devices, self.hass.config.path(YAML_DEVICES), devices
+                )
 
     @callback
     def async_update_stale(self, now: datetime) -> None:
@@ -844,8 +858,12 @@ class Device(RestoreEntity):
         attributes: dict[str, Any] | None = None,
         source_type: SourceType | str = SourceType.GPS,
         consider_home: timedelta | None = None,
-    ) -> None:
-        """Mark the device as seen."""
+    ) -> bool:
+        """Mark the device as seen and return if its state changed."""
+        previous = self._async_state_snapshot()
+        changed = attributes is not None and not (
+            attributes.items() <= self._attributes.items()
+        )
         self.source_type = source_type
         self.last_seen = dt_util.utcnow()
         self.host_name = host_name or self.host_name
@@ -869,6 +887,19 @@ class Device(RestoreEntity):
                 LOGGER.warning("Could not parse gps value for %s: %s", self.dev_id, gps)
 
         await self.async_update()
+        return changed or previous != self._async_state_snapshot()
+
+    @callback
+    def _async_state_snapshot(self) -> tuple[Any, ...]:
+        """Return the values the state of the device is built from."""
+        return (
+            self._state,
+            self.host_name,
+            self.source_type,
+            self.gps,
+            self.gps_accuracy,
+            self.battery,
+        )
 
     def stale(self, now: datetime | None = None) -> bool:
         """Return if device state is stale.
@@ -1022,18 +1053,24 @@ async def async_load_config(
 
 def update_config(path: str, dev_id: str, device: Device) -> None:
     """Add device to YAML configuration file."""
+    update_config_devices(path, [device])
+
+
+def update_config_devices(path: str, devices: list[Device]) -> None:
+    """Add devices to YAML configuration file."""
     with open(path, "a", encoding="utf8") as out:
-        device_config = {
-            device.dev_id: {
-                ATTR_NAME: device.name,
-                ATTR_MAC: device.mac,
-                ATTR_ICON: device.icon,
-                "picture": device.config_picture,
-                "track": device.track,
+        for device in devices:
+            device_config = {
+                device.dev_id: {
+                    ATTR_NAME: device.name,
+                    ATTR_MAC: device.mac,
+                    ATTR_ICON: device.icon,
+                    "picture": device.config_picture,
+                    "track": device.track,
+                }
             }
-        }
-        out.write("\n")
-        out.write(dump(device_config))
+            out.write("\n")
+            out.write(dump(device_config))
 
 
 def remove_device_from_config(hass: HomeAssistant, device_id: str) -> None:
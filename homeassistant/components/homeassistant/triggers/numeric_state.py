@@ -1,7 +1,6 @@
 """Offer numeric state listening automation rules."""
 from __future__ import annotations
 
-from collections.abc import Callable
 from datetime import timedelta
 import logging
 from typing import Any, TypeVar
@@ -27,7 +26,7 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.event import (
     EventStateChangedData,
-    async_track_same_state,
+    async_call_later,
     async_track_state_change_event,
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
@@ -104,7 +103,8 @@ async def async_attach_trigger(
     time_delta = config.get(CONF_FOR)
     template.attach(hass, time_delta)
     value_template = config.get(CONF_VALUE_TEMPLATE)
-    unsub_track_same: dict[str, Callable[[], None]] = {}
+    # Pending `for` timers, cancelled when the criteria are no longer met
+    pending_for: dict[str, CALLBACK_TYPE] = {}
     armed_entities: set[str] = set()
     period: dict[str, timedelta] = {}
     attribute = config.get(CONF_ATTRIBUTE)
@@ -150,6 +150,12 @@ async def async_attach_trigger(
                 ex,
             )
 
+    @callback
+    def cancel_pending_for(entity_id: str) -> None:
+        """Cancel the pending timer of an entity."""
+        if (cancel_timer := pending_for.pop(entity_id, None)) is not None:
+            cancel_timer()
+
     @callback
     def state_automation_listener(event: EventType[EventStateChangedData]) -> None:
         """Listen for state changes and calls action."""
@@ -158,6 +164,7 @@ async def async_attach_trigger(
         to_s = event.data["new_state"]
 
         if to_s is None:
+            cancel_pending_for(entity_id)
             return
 
         @callback
@@ -181,26 +188,15 @@ async def async_attach_trigger(
                 to_s.context,
             )
 
-        @callback
-        def check_numeric_state_no_raise(
-            entity_id: str, from_s: State | None, to_s: State | None
-        ) -> bool:
-            """Return True if the criteria are now met, False otherwise."""
-            try:
-                return check_numeric_state(entity_id, from_s, to_s)
-            except exceptions.ConditionError:
-                # This is an internal same-state listener so we just drop the
-                # error. The same error will be reached and logged by the
-                # primary async_track_state_change_event() listener.
-                return False
-
         try:
             matching = check_numeric_state(entity_id, from_s, to_s)
         except exceptions.ConditionError as ex:
+            cancel_pending_for(entity_id)
             _LOGGER.warning("Error in '%s' trigger: %s", trigger_info["name"], ex)
             return
 
         if not matching:
+            cancel_pending_for(entity_id)
             armed_entities.add(entity_id)
         elif entity_id in armed_entities:
             armed_entities.discard(entity_id)
@@ -218,12 +214,14 @@ async def async_attach_trigger(
                     )
                     return
 
-                unsub_track_same[entity_id] = async_track_same_state(
-                    hass,
-                    period[entity_id],
-                    call_action,
-                    entity_ids=entity_id,
-                    async_check_same_func=check_numeric_state_no_raise,
+                @callback
+                def state_for_listener(_: Any) -> None:
+                    """Call action when the criteria were met for the period."""
+                    del pending_for[entity_id]
+                    call_action()
+
+                pending_for[entity_id] = async_call_later(
+                    hass, period[entity_id], state_for_listener
                 )
             else:
                 call_action()
@@ -234,8 +232,8 @@ async def async_attach_trigger(
     def async_remove() -> None:
         """Remove state listeners async."""
         unsub()
-        for async_remove in unsub_track_same.values():
-            async_remove()
-        unsub_track_same.clear()
+        for cancel_timer in pending_for.values():
+            cancel_timer()
+        pending_for.clear()
 
     return async_remove
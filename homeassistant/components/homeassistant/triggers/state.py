@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import timedelta
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -17,7 +18,7 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.event import (
     EventStateChangedData,
-    async_track_same_state,
+    async_call_later,
     async_track_state_change_event,
     process_state_match,
 )
@@ -61,6 +62,26 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+# A pending `for` timer, with a function checking if the entity still has
+# the state the timer was started for and a function cancelling the timer
+PendingTimer = tuple[Callable[[State | None], bool], CALLBACK_TYPE]
+
+
+@callback
+def _async_cancel_changed_pending(
+    pending_for: dict[str, list[PendingTimer]], entity_id: str, new_state: State | None
+) -> None:
+    """Cancel pending timers of an entity whose state no longer matches."""
+    pending = pending_for[entity_id]
+    for pending_timer in pending.copy():
+        check_same_state, cancel_timer = pending_timer
+        if not check_same_state(new_state):
+            cancel_timer()
+            pending.remove(pending_timer)
+    if not pending:
+        del pending_for[entity_id]
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -115,7 +136,7 @@ async def async_attach_trigger(
     match_all = all(
         item not in config for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
     )
-    unsub_track_same: dict[str, Callable[[], None]] = {}
+    pending_for: dict[str, list[PendingTimer]] = {}
     period: dict[str, timedelta] = {}
     attribute = config.get(CONF_ATTRIBUTE)
     job = HassJob(action, f"state trigger {trigger_info}")
@@ -130,6 +151,9 @@ async def async_attach_trigger(
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
 
+        if entity in pending_for:
+            _async_cancel_changed_pending(pending_for, entity, to_s)
+
         if from_s is None:
             old_value = None
         elif attribute is None:
@@ -202,7 +226,7 @@ async def async_attach_trigger(
             )
             return
 
-        def _check_same_state(_: str, _2: State | None, new_st: State | None) -> bool:
+        def _check_same_state(new_st: State | None) -> bool:
             if new_st is None:
                 return False
 
@@ -217,13 +241,20 @@ async def async_attach_trigger(
 
             return cur_value == new_value
 
-        unsub_track_same[entity] = async_track_same_state(
-            hass,
-            period[entity],
-            call_action,
+        @callback
+        def _state_for_listener(_: Any) -> None:
+            """Call action when the state was kept for the period."""
+            pending = pending_for[entity]
+            pending.remove(pending_timer)
+            if not pending:
+                del pending_for[entity]
+            call_action()
+
+        pending_timer = (
             _check_same_state,
-            entity_ids=entity,
+            async_call_later(hass, period[entity], _state_for_listener),
         )
+        pending_for.setdefault(entity, []).append(pending_timer)
 
     unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
 
@@ -231,8 +262,9 @@ async def async_attach_trigger(
     def async_remove() -> None:
         """Remove state listeners async."""
         unsub()
-        for async_remove in unsub_track_same.values():
-            async_remove()
-        unsub_track_same.clear()
+        for pending in pending_for.values():
+            for _, cancel_timer in pending:
+                cancel_timer()
+        pending_for.clear()
 
     return async_remove
@@ -4,12 +4,14 @@ from __future__ import annotations
 import asyncio
 from datetime import timedelta
 from enum import StrEnum
+from functools import partial
 import logging
-from typing import Any, Final, TypedDict, final
+from typing import TYPE_CHECKING, Any, Final, TypedDict, final
 
 import voluptuous as vol
 
 from homeassistant.components.camera import Image
+from homeassistant.components.camera.shared_image import SharedImageRequests
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NAME,
@@ -61,6 +63,11 @@ CONF_CONFIDENCE = "confidence"
 DEFAULT_TIMEOUT = 10
 DEFAULT_CONFIDENCE = 80
 
+DATA_CAMERA_IMAGES = "image_processing_camera_images"
+# Seconds an image fetched from a camera is shared with other entities processing
+# the same camera
+SHARED_IMAGE_MAX_AGE = 1
+
 SOURCE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_domain("camera"),
@@ -118,6 +125,30 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+async def _async_get_camera_image(
+    hass: HomeAssistant, camera_entity: str, timeout: int
+) -> Image:
+    """Fetch an image from a camera, shared by all entities processing it.
+
+    Entities updating at the same time share a single fetch, and an image is
+    reused for SHARED_IMAGE_MAX_AGE seconds.
+    """
+    return await _async_get_camera_images(hass).async_get(
+        camera_entity,
+        SHARED_IMAGE_MAX_AGE,
+        partial(hass.components.camera.async_get_image, camera_entity, timeout=timeout),
+        f"image processing get image {camera_entity}",
+    )
+
+
+@callback
+def _async_get_camera_images(hass: HomeAssistant) -> SharedImageRequests[str, Image]:
+    """Return the images shared by the entities processing cameras."""
+    if (camera_images := hass.data.get(DATA_CAMERA_IMAGES)) is None:
+        camera_images = hass.data[DATA_CAMERA_IMAGES] = SharedImageRequests(hass)
+    return camera_images  # type: ignore[no-any-return]
+
+
 class ImageProcessingEntityDescription(EntityDescription, frozen_or_thawed=True):
     """A class that describes sensor entities."""
 
@@ -175,11 +206,12 @@ class ImageProcessingEntity(Entity):
 
         This method is a coroutine.
         """
-        camera = self.hass.components.camera
+        if TYPE_CHECKING:
+            assert self.camera_entity is not None
 
         try:
-            image: Image = await camera.async_get_image(
-                self.camera_entity, timeout=self.timeout
+            image = await _async_get_camera_image(
+                self.hass, self.camera_entity, self.timeout
             )
 
         except HomeAssistantError as err:
@@ -189,6 +221,12 @@ class ImageProcessingEntity(Entity):
         # process image data
         await self.async_process_image(image.content)
 
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Drop the shared image of the camera when the entity is removed."""
+        await super().async_internal_will_remove_from_hass()
+        if self.camera_entity is not None:
+            _async_get_camera_images(self.hass).async_remove(self.camera_entity)
+
 
 class ImageProcessingFaceEntity(ImageProcessingEntity):
     """Base entity class for face image processing."""
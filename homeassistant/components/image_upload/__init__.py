@@ -29,6 +29,8 @@ STORAGE_KEY = "image"
 STORAGE_VERSION = 1
 VALID_SIZES = {256, 512}
 MAX_SIZE = 1024 * 1024 * 10
+# Decoding large images takes a lot of memory, limit how many run at once
+MAX_CONCURRENT_TRANSFORMS = 2
 
 CREATE_FIELDS = {
     vol.Required("file"): FileField,
@@ -179,7 +181,8 @@ class ImageServeView(HomeAssistantView):
         image_collection: ImageStorageCollection,
     ) -> None:
         """Initialize image serve view."""
-        self.transform_lock = asyncio.Lock()
+        self.transforms: dict[pathlib.Path, asyncio.Task[None]] = {}
+        self.transform_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSFORMS)
         self.image_folder = image_folder
         self.image_collection = image_collection
 
@@ -204,23 +207,48 @@ class ImageServeView(HomeAssistantView):
         target_file = self.image_folder / image_id / f"{width}x{height}"
 
         if not target_file.is_file():
-            async with self.transform_lock:
-                # Another check in case another request already
-                # finished it while waiting
-                if not target_file.is_file():
-                    await hass.async_add_executor_job(
-                        _generate_thumbnail,
+            # Share the transform between concurrent requests for the same size,
+            # up to MAX_CONCURRENT_TRANSFORMS other images and sizes are generated
+            # in parallel
+            if (transform := self.transforms.get(target_file)) is None:
+                transform = self.transforms[target_file] = hass.async_create_task(
+                    self._async_generate_thumbnail(
+                        hass,
                         self.image_folder / image_id / "original",
                         image_info["content_type"],
                         target_file,
                         (width, height),
-                    )
+                    ),
+                    f"image_upload transform {target_file}",
+                )
+                transform.add_done_callback(
+                    lambda _: self.transforms.pop(target_file, None)
+                )
+            await asyncio.shield(transform)
 
         return web.FileResponse(
             target_file,
             headers={**CACHE_HEADERS, hdrs.CONTENT_TYPE: image_info["content_type"]},
         )
 
+    async def _async_generate_thumbnail(
+        self,
+        hass: HomeAssistant,
+        original_path: pathlib.Path,
+        content_type: str,
+        target_path: pathlib.Path,
+        target_size: tuple[int, int],
+    ) -> None:
+        """Generate a size once a transform slot is available."""
+        async with self.transform_semaphore:
+            await hass.async_add_executor_job(
+                _generate_thumbnail,
+                original_path,
+                content_type,
+                target_path,
+                target_size,
+            )
+
 
 def _generate_thumbnail(
     original_path: pathlib.Path,
@@ -229,7 +257,11 @@ def _generate_thumbnail(
     target_size: tuple[int, int],
 ) -> None:
     """Generate a size."""
-    image = ImageOps.exif_transpose(Image.open(original_path))
+    image = Image.open(original_path)
+    # Let the JPEG decoder scale down while decoding instead of
+    # decoding the full size image, this is a no-op for other formats
+    image.draft(image.mode, target_size)
+    image = ImageOps.exif_transpose(image)
     image.thumbnail(target_size)
     image.save(target_path, format=content_type.partition("/")[-1])
 
@@ -64,9 +64,14 @@ from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.context import context_ids_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
+# The maximum number of contexts that may have originated before
+# the requested period to look up for a single request
+MAX_CONTEXT_LOOKUPS = 100
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -165,9 +170,40 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
-            )
+            rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            if self.logbook_run.memoize_new_contexts and (
+                context_ids := self._missing_context_ids(rows)
+            ):
+                rows = [
+                    *execute_stmt_lambda_element(
+                        session,
+                        context_ids_stmt(start_day.timestamp(), context_ids),
+                        orm_rows=False,
+                    ),
+                    *rows,
+                ]
+            return self.humanify(rows)
+
+    def _missing_context_ids(self, rows: Sequence[Row] | Result) -> list[bytes] | None:
+        """Find the contexts of the rows that may have originated before them.
+
+        These are the contexts of the rows and their parent contexts
+        that are not known yet, the earliest rows come first since
+        their contexts are the most likely to have started earlier.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        missing: dict[bytes, None] = {}
+        for row in rows:
+            for context_id_bin in (row.context_id_bin, row.context_parent_id_bin):
+                if (
+                    context_id_bin
+                    and context_id_bin not in context_lookup
+                    and context_id_bin not in missing
+                ):
+                    missing[context_id_bin] = None
+                    if len(missing) == MAX_CONTEXT_LOOKUPS:
+                        return list(missing)
+        return list(missing) or None
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
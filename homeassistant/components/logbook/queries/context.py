@@ -0,0 +1,71 @@
+"""Context queries for logbook."""
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import func, lambda_stmt, select, union_all
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.sql.selectable import Select
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+
+def context_ids_stmt(
+    start_day: float, context_id_bins: Collection[bytes]
+) -> StatementLambdaElement:
+    """Generate a logbook query for the origin rows of context ids.
+
+    Only the first row of each context before the start of the
+    requested period is selected, since the later rows of a
+    context are never used to describe it.
+
+    The rows are marked as context_only since they are only
+    used to link contexts that originated outside of the
+    requested period.
+    """
+    return lambda_stmt(lambda: _select_context_origins(start_day, context_id_bins))
+
+
+def _select_context_origins(
+    start_day: float, context_id_bins: Collection[bytes]
+) -> Select:
+    """Select the first row of each context before the start day."""
+    rows = union_all(
+        apply_events_context_hints(
+            select_events_context_only()
+            .where(Events.context_id_bin.in_(context_id_bins))
+            .where(Events.time_fired_ts < start_day)
+            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        ),
+        apply_states_context_hints(
+            select_states_context_only()
+            .where(States.context_id_bin.in_(context_id_bins))
+            .where(States.last_updated_ts < start_day)
+            .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+        ),
+    ).subquery()
+    ranked_rows = select(
+        rows,
+        func.row_number()
+        .over(partition_by=rows.c.context_id_bin, order_by=rows.c.time_fired_ts)
+        .label("context_row_number"),
+    ).subquery()
+    return (
+        select(*(ranked_rows.c[column.name] for column in rows.c))
+        .where(ranked_rows.c.context_row_number == 1)
+        .order_by(ranked_rows.c.time_fired_ts)
+    )
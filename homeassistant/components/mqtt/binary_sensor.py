@@ -28,14 +28,20 @@ from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 import homeassistant.helpers.event as evt
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_call_later_coarse
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
 from . import subscription
 from .config import MQTT_RO_SCHEMA
-from .const import CONF_ENCODING, CONF_QOS, CONF_STATE_TOPIC, PAYLOAD_NONE
+from .const import (
+    CONF_ENCODING,
+    CONF_QOS,
+    CONF_STATE_TOPIC,
+    EXPIRE_AFTER_TIMER_NAME,
+    PAYLOAD_NONE,
+)
 from .debug_info import log_messages
 from .mixins import (
     MQTT_ENTITY_COMMON_SCHEMA,
@@ -119,8 +125,11 @@ class MqttBinarySensor(MqttEntity, BinarySensorEntity, RestoreEntity):
             self._expired = False
             self._attr_is_on = last_state.state == STATE_ON
 
-            self._expiration_trigger = async_call_later(
-                self.hass, remain_seconds, self._value_is_expired
+            self._expiration_trigger = async_call_later_coarse(
+                self.hass,
+                remain_seconds,
+                self._value_is_expired,
+                name=EXPIRE_AFTER_TIMER_NAME,
             )
             _LOGGER.debug(
                 (
@@ -187,8 +196,11 @@ class MqttBinarySensor(MqttEntity, BinarySensorEntity, RestoreEntity):
                     self._expiration_trigger()
 
                 # Set new trigger
-                self._expiration_trigger = async_call_later(
-                    self.hass, self._expire_after, self._value_is_expired
+                self._expiration_trigger = async_call_later_coarse(
+                    self.hass,
+                    self._expire_after,
+                    self._value_is_expired,
+                    name=EXPIRE_AFTER_TIMER_NAME,
                 )
 
             payload = self._value_template(msg.payload)
@@ -117,6 +117,9 @@ DEFAULT_KEEPALIVE = 60
 DEFAULT_PROTOCOL = PROTOCOL_311
 DEFAULT_TRANSPORT = TRANSPORT_TCP
 
+# Owner name of the coarse timers which expire sensors with expire_after set
+EXPIRE_AFTER_TIMER_NAME = "mqtt expire_after"
+
 DEFAULT_BIRTH = {
     ATTR_TOPIC: DEFAULT_BIRTH_WILL_TOPIC,
     CONF_PAYLOAD: DEFAULT_PAYLOAD_AVAILABLE,
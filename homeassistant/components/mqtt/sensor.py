@@ -31,13 +31,19 @@ from homeassistant.const import (
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_call_later_coarse
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
 from . import subscription
 from .config import MQTT_RO_SCHEMA
-from .const import CONF_ENCODING, CONF_QOS, CONF_STATE_TOPIC, PAYLOAD_NONE
+from .const import (
+    CONF_ENCODING,
+    CONF_QOS,
+    CONF_STATE_TOPIC,
+    EXPIRE_AFTER_TIMER_NAME,
+    PAYLOAD_NONE,
+)
 from .debug_info import log_messages
 from .mixins import (
     MQTT_ENTITY_COMMON_SCHEMA,
@@ -153,8 +159,11 @@ class MqttSensor(MqttEntity, RestoreSensor):
             self._expired = False
             self._attr_native_value = last_sensor_data.native_value
 
-            self._expiration_trigger = async_call_later(
-                self.hass, remain_seconds, self._value_is_expired
+            self._expiration_trigger = async_call_later_coarse(
+                self.hass,
+                remain_seconds,
+                self._value_is_expired,
+                name=EXPIRE_AFTER_TIMER_NAME,
             )
             _LOGGER.debug(
                 (
@@ -219,8 +228,11 @@ class MqttSensor(MqttEntity, RestoreSensor):
                     self._expiration_trigger()
 
                 # Set new trigger
-                self._expiration_trigger = async_call_later(
-                    self.hass, self._expire_after, self._value_is_expired
+                self._expiration_trigger = async_call_later_coarse(
+                    self.hass,
+                    self._expire_after,
+                    self._value_is_expired,
+                    name=EXPIRE_AFTER_TIMER_NAME,
                 )
 
             payload = self._template(msg.payload, PayloadSentinel.DEFAULT)
@@ -20,7 +20,10 @@ from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_get_coarse_timers_by_owner,
+    async_track_time_interval,
+)
 from homeassistant.helpers.service import async_register_admin_service
 
 from .const import DOMAIN
@@ -250,6 +253,8 @@ async def async_setup_entry(  # noqa: C901
             for handle in getattr(hass.loop, "_scheduled"):
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
+            for owner, count in async_get_coarse_timers_by_owner(hass).items():
+                _LOGGER.critical("Scheduled coarse: %s (%s timers)", owner, count)
         finally:
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
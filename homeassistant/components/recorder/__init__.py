@@ -52,6 +52,7 @@ DEFAULT_COMMIT_INTERVAL = 5
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
+CONF_COMPACT_KEEP_DAYS = "compact_keep_days"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
@@ -85,6 +86,17 @@ def validate_db_url(db_url: str) -> Any:
     return db_url
 
 
+def _validate_compact_keep_days(conf: dict[str, Any]) -> dict[str, Any]:
+    """Validate states are compacted before they are purged."""
+    if (compact_keep_days := conf.get(CONF_COMPACT_KEEP_DAYS)) is not None and (
+        compact_keep_days >= conf[CONF_PURGE_KEEP_DAYS]
+    ):
+        raise vol.Invalid(
+            f"{CONF_COMPACT_KEEP_DAYS} must be less than {CONF_PURGE_KEEP_DAYS}"
+        )
+    return conf
+
+
 CONFIG_SCHEMA = vol.Schema(
     {
         vol.Optional(DOMAIN, default=dict): vol.All(
@@ -97,6 +109,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
+                    vol.Optional(CONF_COMPACT_KEEP_DAYS): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
@@ -113,6 +128,7 @@ CONFIG_SCHEMA = vol.Schema(
                     ): cv.boolean,
                 }
             ),
+            _validate_compact_keep_days,
         )
     },
     extra=vol.ALLOW_EXTRA,
@@ -138,6 +154,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
+    compact_keep_days = conf.get(CONF_COMPACT_KEEP_DAYS)
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
@@ -160,6 +177,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        compact_keep_days=compact_keep_days,
     )
     instance.async_initialize()
     instance.async_register()
@@ -49,6 +49,9 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
 
+COMPACT_STORAGE_KEY = f"{DOMAIN}.compact_states"
+COMPACT_STORAGE_VERSION = 1
+
 STATISTICS_ROWS_SCHEMA_VERSION = 23
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
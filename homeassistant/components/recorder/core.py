@@ -36,12 +36,15 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
 from .const import (
+    COMPACT_STORAGE_KEY,
+    COMPACT_STORAGE_VERSION,
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -98,6 +101,7 @@ from .tasks import (
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
     CommitTask,
+    CompactStatesTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
     EntityIDMigrationTask,
@@ -178,6 +182,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        compact_keep_days: int | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -187,6 +192,11 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.compact_keep_days = compact_keep_days
+        self._compact_store: Store[dict[str, float]] = Store(
+            hass, COMPACT_STORAGE_VERSION, COMPACT_STORAGE_KEY
+        )
+        self._compacted_before: datetime | None | UndefinedType = UNDEFINED
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
@@ -541,9 +551,36 @@ class Recorder(threading.Thread):
             repack = self.auto_repack and is_second_sunday(now)
             purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
             self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
+            if self.compact_keep_days is not None:
+                # States between the purge and compact cutoff are
+                # reduced to state changes only
+                compact_before = dt_util.utcnow() - timedelta(
+                    days=self.compact_keep_days
+                )
+                self.hass.async_create_task(
+                    self._async_queue_compact_states_task(compact_before),
+                    "recorder compact states",
+                )
         else:
             self.queue_task(PerodicCleanupTask())
 
+    async def _async_queue_compact_states_task(self, compact_before: datetime) -> None:
+        """Queue a task to compact the states since the previous compaction."""
+        if self._compacted_before is UNDEFINED:
+            data = await self._compact_store.async_load()
+            self._compacted_before = (
+                dt_util.utc_from_timestamp(data["compacted_before"]) if data else None
+            )
+        self.queue_task(CompactStatesTask(compact_before, self._compacted_before))
+
+    @callback
+    def async_set_compacted_before(self, compacted_before: datetime) -> None:
+        """Persist the time states have been compacted up to."""
+        self._compacted_before = compacted_before
+        self._compact_store.async_delay_save(
+            lambda: {"compacted_before": compacted_before.timestamp()}
+        )
+
     @callback
     def _async_five_minute_tasks(self, now: datetime) -> None:
         """Run tasks every five minutes."""
@@ -1,6 +1,7 @@
 """Purge old data helper."""
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Callable
 from datetime import datetime
 from itertools import zip_longest
@@ -10,6 +11,9 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.orm.session import Session
 
+import homeassistant.util.dt as dt_util
+
+from .const import SupportedDialect
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -27,6 +31,7 @@ from .queries import (
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    find_attributes_only_states_to_compact,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -34,9 +39,12 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_attributes_only_state_without_next_state,
     find_short_term_statistics_to_purge,
+    find_states_linked_to_old_state_ids,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    update_states_old_state_id,
 )
 from .repack import repack_database
 from .util import chunked_or_all, retryable_database_job, session_scope
@@ -50,6 +58,13 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The maximum time in seconds to spend selecting and deleting batches
+# from a single table in a purge cycle. Once exceeded the purge cycle
+# is finished early and a new one is scheduled so the recorder can
+# process the events that were queued in the meantime. This adapts the
+# number of batches per cycle to the latency of the database.
+PURGE_TABLE_TIME_SLICE = 5.0
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -189,6 +204,7 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    deadline = time.monotonic() + PURGE_TABLE_TIME_SLICE
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before, max_bind_vars
@@ -198,6 +214,9 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() > deadline:
+            _LOGGER.debug("Purging states exceeded the time slice for this cycle")
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -224,6 +243,7 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    deadline = time.monotonic() + PURGE_TABLE_TIME_SLICE
     for _ in range(events_batch_size):
         event_ids, data_ids = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
@@ -233,6 +253,9 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() > deadline:
+            _LOGGER.debug("Purging events exceeded the time slice for this cycle")
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -515,7 +538,19 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     # the delete does not fail due to a foreign key constraint
     # since some databases (MSSQL) cannot do the ON DELETE SET NULL
     # for us.
-    disconnected_rows = session.execute(disconnect_states_rows(state_ids))
+    database_engine = instance.database_engine
+    assert database_engine is not None
+    if database_engine.dialect == SupportedDialect.MYSQL:
+        # MySQL and MariaDB check foreign keys row by row so every
+        # state that links to a purged state has to be disconnected
+        disconnected_rows = session.execute(disconnect_states_rows(state_ids))
+    else:
+        # SQLite and PostgreSQL check foreign keys at the end of the
+        # statement. Since states are purged oldest first, almost all
+        # states linking to a purged state are deleted by the same
+        # statement, so only the states that are kept are disconnected
+        # instead of rewriting every row right before deleting it.
+        disconnected_rows = _disconnect_kept_states(instance, session, state_ids)
     _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
 
     deleted_rows = session.execute(delete_states_rows(state_ids))
@@ -525,6 +560,24 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     instance.states_manager.evict_purged_state_ids(state_ids)
 
 
+def _disconnect_kept_states(
+    instance: Recorder, session: Session, state_ids: set[int]
+) -> int:
+    """Disconnect states that are kept from the state ids that are purged."""
+    kept_state_ids: set[int] = set()
+    for state_ids_chunk in chunked_or_all(state_ids, instance.max_bind_vars):
+        kept_state_ids.update(
+            state_id
+            for state_id, _ in session.execute(
+                find_states_linked_to_old_state_ids(state_ids_chunk)
+            ).all()
+            if state_id not in state_ids
+        )
+    for kept_state_ids_chunk in chunked_or_all(kept_state_ids, instance.max_bind_vars):
+        session.execute(update_states_old_state_id(kept_state_ids_chunk, None))
+    return len(kept_state_ids)
+
+
 def _purge_batch_attributes_ids(
     instance: Recorder, session: Session, attributes_ids: set[int]
 ) -> None:
@@ -795,3 +848,109 @@ def purge_entity_data(
         _purge_old_entity_ids(instance, session)
 
     return True
+
+
+@retryable_database_job("compact_old_states")
+def compact_old_states(
+    instance: Recorder,
+    compact_before: datetime,
+    compacted_before: datetime | None = None,
+) -> bool:
+    """Compact states older than compact_before to state changes only.
+
+    States that only changed attributes are removed and the states that
+    followed them are linked to the previous state instead, so the history
+    of the state itself is kept. The latest state of an entity is never
+    removed since it is still linked by the recorder.
+
+    States older than compacted_before were already compacted by a previous
+    run and are not scanned again.
+
+    Returns true if there are no more states to compact.
+    """
+    _LOGGER.debug(
+        "Compacting states before target %s",
+        compact_before.isoformat(sep=" ", timespec="seconds"),
+    )
+    compact_before_timestamp = compact_before.timestamp()
+    compacted_before_timestamp = compacted_before.timestamp() if compacted_before else 0
+    max_bind_vars = instance.max_bind_vars
+    has_remaining_state_ids_to_compact = True
+    attributes_ids_batch: set[int] = set()
+    with session_scope(session=instance.get_session()) as session:
+        deadline = time.monotonic() + PURGE_TABLE_TIME_SLICE
+        for _ in range(DEFAULT_STATES_BATCHES_PER_PURGE):
+            old_state_ids: dict[int, int | None] = {}
+            for state_id, old_state_id, attributes_id in session.execute(
+                find_attributes_only_states_to_compact(
+                    compacted_before_timestamp, compact_before_timestamp, max_bind_vars
+                )
+            ).all():
+                old_state_ids[state_id] = old_state_id
+                if attributes_id:
+                    attributes_ids_batch.add(attributes_id)
+            if not old_state_ids:
+                has_remaining_state_ids_to_compact = False
+                break
+            _relink_states_to_compacted_old_states(instance, session, old_state_ids)
+            _purge_state_ids(instance, session, set(old_state_ids))
+            if time.monotonic() > deadline:
+                _LOGGER.debug(
+                    "Compacting states exceeded the time slice for this cycle"
+                )
+                break
+
+        _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+
+    _LOGGER.debug(
+        "After compacting states remaining=%s", has_remaining_state_ids_to_compact
+    )
+    return not has_remaining_state_ids_to_compact
+
+
+def find_compacted_before(
+    instance: Recorder,
+    compact_before: datetime,
+    compacted_before: datetime | None = None,
+) -> datetime:
+    """Return the time states have been compacted up to.
+
+    States that only changed attributes but were the newest state of
+    their entity could not be compacted, they are scanned again by the
+    next run once a newer state may follow them.
+    """
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        oldest_skipped_ts: float | None = session.execute(
+            find_oldest_attributes_only_state_without_next_state(
+                compacted_before.timestamp() if compacted_before else 0,
+                compact_before.timestamp(),
+            )
+        ).scalar()
+    if oldest_skipped_ts is None:
+        return compact_before
+    return dt_util.utc_from_timestamp(oldest_skipped_ts)
+
+
+def _relink_states_to_compacted_old_states(
+    instance: Recorder, session: Session, old_state_ids: dict[int, int | None]
+) -> None:
+    """Link states that follow states being removed to the state before them."""
+    relink: defaultdict[int | None, set[int]] = defaultdict(set)
+    removed_state_ids = set(old_state_ids)
+    for state_ids_chunk in chunked_or_all(removed_state_ids, instance.max_bind_vars):
+        for state_id, removed_state_id in session.execute(
+            find_states_linked_to_old_state_ids(state_ids_chunk)
+        ).all():
+            if state_id in old_state_ids:
+                # This state is removed as well
+                continue
+            # Follow the chain of removed states to the first one we keep
+            old_state_id = old_state_ids[removed_state_id]
+            while old_state_id in old_state_ids:
+                old_state_id = old_state_ids[old_state_id]
+            relink[old_state_id].add(state_id)
+
+    for old_state_id, state_ids in relink.items():
+        for state_ids_chunk in chunked_or_all(state_ids, instance.max_bind_vars):
+            session.execute(update_states_old_state_id(state_ids_chunk, old_state_id))
+    _LOGGER.debug("Linked %s states to their compacted old state", len(relink))
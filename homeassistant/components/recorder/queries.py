@@ -4,7 +4,17 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    delete,
+    distinct,
+    exists,
+    func,
+    lambda_stmt,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -17,6 +27,7 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -634,6 +645,81 @@ def find_states_to_purge(
     )
 
 
+NEXT_STATE = aliased(States, name="next_state")
+
+
+def find_attributes_only_states_to_compact(
+    compacted_before: float, compact_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find states that only changed attributes and are followed by a newer state.
+
+    States of entities that have statistics are not compacted.
+    """
+    return lambda_stmt(
+        lambda: select(States.state_id, States.old_state_id, States.attributes_id)
+        .filter(States.last_updated_ts >= compacted_before)
+        .filter(States.last_updated_ts < compact_before)
+        .filter(States.last_changed_ts.is_not(None))
+        .filter(States.last_changed_ts != States.last_updated_ts)
+        .filter(exists().where(NEXT_STATE.old_state_id == States.state_id))
+        .filter(
+            States.metadata_id.not_in(
+                select(StatesMeta.metadata_id).join(
+                    StatisticsMeta, StatisticsMeta.statistic_id == StatesMeta.entity_id
+                )
+            )
+        )
+        .limit(max_bind_vars)
+    )
+
+
+def find_oldest_attributes_only_state_without_next_state(
+    compacted_before: float, compact_before: float
+) -> StatementLambdaElement:
+    """Find the oldest state that only changed attributes without a newer state.
+
+    These states can only be compacted once a newer state follows them.
+    """
+    return lambda_stmt(
+        lambda: select(func.min(States.last_updated_ts))
+        .filter(States.last_updated_ts >= compacted_before)
+        .filter(States.last_updated_ts < compact_before)
+        .filter(States.last_changed_ts.is_not(None))
+        .filter(States.last_changed_ts != States.last_updated_ts)
+        .filter(~exists().where(NEXT_STATE.old_state_id == States.state_id))
+        .filter(
+            States.metadata_id.not_in(
+                select(StatesMeta.metadata_id).join(
+                    StatisticsMeta, StatisticsMeta.statistic_id == StatesMeta.entity_id
+                )
+            )
+        )
+    )
+
+
+def find_states_linked_to_old_state_ids(
+    state_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find states linked to old state ids."""
+    return lambda_stmt(
+        lambda: select(States.state_id, States.old_state_id).where(
+            States.old_state_id.in_(state_ids)
+        )
+    )
+
+
+def update_states_old_state_id(
+    state_ids: Iterable[int], old_state_id: int | None
+) -> StatementLambdaElement:
+    """Link states rows to a new old state id."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.state_id.in_(state_ids))
+        .values(old_state_id=old_state_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
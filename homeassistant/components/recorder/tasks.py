@@ -125,6 +125,31 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class CompactStatesTask(RecorderTask):
+    """Object to store information about a compact states task."""
+
+    compact_before: datetime
+    compacted_before: datetime | None = None
+
+    def run(self, instance: Recorder) -> None:
+        """Compact old states in the database."""
+        if purge.compact_old_states(
+            instance, self.compact_before, self.compacted_before
+        ):
+            instance.hass.add_job(
+                instance.async_set_compacted_before,
+                purge.find_compacted_before(
+                    instance, self.compact_before, self.compacted_before
+                ),
+            )
+            return
+        # Schedule a new compact task if this one didn't finish
+        instance.queue_task(
+            CompactStatesTask(self.compact_before, self.compacted_before)
+        )
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
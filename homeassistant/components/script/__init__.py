@@ -11,6 +11,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_runs
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -42,6 +43,10 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import (
+    async_get_referencing_entity_ids,
+    async_track_entity_references,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -84,6 +89,8 @@ SCRIPT_TURN_ONOFF_SCHEMA = make_entity_service_schema(
 )
 RELOAD_SERVICE_SCHEMA = vol.Schema({})
 
+DATA_REFERENCES = "script_references"
+
 
 @bind_hass
 def is_on(hass, entity_id):
@@ -100,11 +107,9 @@ def _scripts_with_x(
 
     component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
 
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
-    ]
+    return async_get_referencing_entity_ids(
+        hass, DATA_REFERENCES, component.entities, property_name, referenced_id
+    )
 
 
 def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> list[str]:
@@ -159,16 +164,7 @@ def areas_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all scripts that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if script_entity.referenced_blueprint == blueprint_path
-    ]
+    return _scripts_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -335,24 +331,23 @@ async def _async_process_config(
     ) -> tuple[set[int], set[int]]:
         """Find matches between a list of script entities and a list of configurations.
 
-        A script or configuration is only allowed to match at most once to handle
-        the case of multiple scripts with identical configuration.
-
         Returns a tuple of sets of indices: ({script_matches}, {config_matches})
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        # Script keys are unique, a script can only match the config with its key
+        script_configs_by_key: dict[str, tuple[int, ScriptEntityConfig]] = {
+            config.key: (config_idx, config)
+            for config_idx, config in enumerate(script_configs)
+        }
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, config in enumerate(script_configs):
-                if config_idx in config_matches:
-                    # Only allow a script config to match at most once
-                    continue
-                if script_matches_config(script, config):
-                    script_matches.add(script_idx)
-                    config_matches.add(config_idx)
-                    # Only allow a script to match at most once
-                    break
+            if script.unique_id not in script_configs_by_key:
+                continue
+            config_idx, config = script_configs_by_key.pop(script.unique_id)
+            if script_matches_config(script, config):
+                script_matches.add(script_idx)
+                config_matches.add(config_idx)
 
         return script_matches, config_matches
 
@@ -407,6 +402,11 @@ class BaseScriptEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Drop the index of referenced ids when the script is added or removed."""
+        await super().async_internal_added_to_hass()
+        async_track_entity_references(self.hass, DATA_REFERENCES, self)
+
 
 class UnavailableScriptEntity(BaseScriptEntity):
     """A non-functional script entity with its state set to unavailable.
@@ -645,6 +645,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self.unique_id)
+        async_remove_trace_runs(self.hass, DOMAIN, self.unique_id)
 
 
 @websocket_api.websocket_command({"type": "script/config", "entity_id": str})
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from contextlib import suppress
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
@@ -38,6 +39,7 @@ from homeassistant.helpers.script import (
 )
 from homeassistant.helpers.selector import validate_selector
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.validated_config import ValidatedConfigCache
 from homeassistant.util.yaml.input import UndefinedSubstitution
 
 from .const import (
@@ -257,16 +259,30 @@ async def async_validate_config_item(
 
 async def async_validate_config(hass, config):
     """Validate config."""
+    # Scripts which are unchanged since the previous validation are not validated
+    # again. Blueprint scripts are always validated since the blueprint may have
+    # changed.
+    validated_configs: ValidatedConfigCache[ScriptConfig] = ValidatedConfigCache(
+        hass, DOMAIN
+    )
     scripts = {}
     for _, p_config in config_per_platform(config, DOMAIN):
         for object_id, cfg in p_config.items():
             if object_id in scripts:
                 LOGGER.warning("Duplicate script detected with name: '%s'", object_id)
                 continue
-            cfg = await _try_async_validate_config_item(hass, object_id, cfg)
+            if is_blueprint_instance_config(cfg):
+                cfg = await _try_async_validate_config_item(hass, object_id, cfg)
+            else:
+                cfg = await validated_configs.async_get_or_validate(
+                    (object_id, cfg),
+                    partial(_try_async_validate_config_item, hass, object_id, cfg),
+                )
             if cfg is not None:
                 scripts[object_id] = cfg
 
+    validated_configs.async_store()
+
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
     config = config_without_domain(config, DOMAIN)
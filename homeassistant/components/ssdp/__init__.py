@@ -247,29 +247,36 @@ class IntegrationMatchers:
         Here we convert the primary match keys into their own
         dicts so we can do lookups of the primary match
         key to find the match dict.
+
+        Since every key of a matcher has to match, each matcher
+        is only stored under the first primary match key it has.
+        The keys are stored in lowercase so matching can be
+        done against a plain dict instead of looking up every
+        key in the CaseInsensitiveDict.
         """
-        self._match_by_key = {}
-        for key in PRIMARY_MATCH_KEYS:
-            matchers_by_key = self._match_by_key[key] = {}
-            for domain, matchers in integration_matchers.items():
-                for matcher in matchers:
+        self._match_by_key = {key.lower(): {} for key in PRIMARY_MATCH_KEYS}
+        for domain, matchers in integration_matchers.items():
+            for matcher in matchers:
+                for key in PRIMARY_MATCH_KEYS:
                     if match_value := matcher.get(key):
-                        matchers_by_key.setdefault(match_value, []).append(
-                            (domain, matcher)
-                        )
+                        self._match_by_key[key.lower()].setdefault(
+                            match_value, []
+                        ).append((domain, {k.lower(): v for k, v in matcher.items()}))
+                        break
 
     @core_callback
     def async_matching_domains(self, info_with_desc: CaseInsensitiveDict) -> set[str]:
         """Find domains matching the passed CaseInsensitiveDict."""
         assert self._match_by_key is not None
+        lower_info_with_desc = info_with_desc.as_lower_dict()
         domains = set()
         for key, matchers_by_key in self._match_by_key.items():
-            if not (match_value := info_with_desc.get(key)):
+            if not (match_value := lower_info_with_desc.get(key)):
                 continue
-            for domain, matcher in matchers_by_key.get(match_value, []):
+            for domain, matcher in matchers_by_key.get(match_value, ()):
                 if domain in domains:
                     continue
-                if all(info_with_desc.get(k) == v for (k, v) in matcher.items()):
+                if matcher.items() <= lower_info_with_desc.items():
                     domains.add(domain)
         return domains
 
@@ -440,8 +447,10 @@ class Scanner:
         assert self._description_cache
 
         location = ssdp_device.location
-        _, info_desc = self._description_cache.peek_description_dict(location)
-        if info_desc is None:
+        has_description, info_desc = self._description_cache.peek_description_dict(
+            location
+        )
+        if not has_description:
             # Fetch info desc in separate task and process from there.
             self.hass.async_create_task(
                 self._ssdp_listener_process_callback_with_lookup(
@@ -450,8 +459,9 @@ class Scanner:
             )
             return
 
-        # Info desc known, process directly.
-        self._ssdp_listener_process_callback(ssdp_device, dst, source, info_desc)
+        # Info desc known, process directly. Devices without a usable
+        # description are cached as well, they are not fetched again.
+        self._ssdp_listener_process_callback(ssdp_device, dst, source, info_desc or {})
 
     async def _ssdp_listener_process_callback_with_lookup(
         self,
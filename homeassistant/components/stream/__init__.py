@@ -20,6 +20,7 @@ import asyncio
 from collections.abc import Callable, Mapping
 import copy
 import logging
+from random import uniform
 import secrets
 import threading
 import time
@@ -38,6 +39,7 @@ from homeassistant.helpers.typing import ConfigType
 from .const import (
     ATTR_ENDPOINTS,
     ATTR_SETTINGS,
+    ATTR_SOURCE_OPEN_SEMAPHORE,
     ATTR_STREAMS,
     CONF_EXTRA_PART_WAIT_TIME,
     CONF_LL_HLS,
@@ -48,6 +50,7 @@ from .const import (
     DOMAIN,
     FORMAT_CONTENT_TYPE,
     HLS_PROVIDER,
+    MAX_CONCURRENT_SOURCE_OPENS,
     MAX_SEGMENTS,
     OUTPUT_FORMATS,
     OUTPUT_IDLE_TIMEOUT,
@@ -56,6 +59,7 @@ from .const import (
     SEGMENT_DURATION_ADJUSTER,
     SOURCE_TIMEOUT,
     STREAM_RESTART_INCREMENT,
+    STREAM_RESTART_JITTER,
     STREAM_RESTART_RESET_TIME,
 )
 from .core import (
@@ -222,6 +226,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = []
+    # Limit the number of stream sources being opened at the same time, to avoid
+    # connecting to all cameras at once when many streams start together
+    hass.data[DOMAIN][ATTR_SOURCE_OPEN_SEMAPHORE] = threading.BoundedSemaphore(
+        MAX_CONCURRENT_SOURCE_OPENS
+    )
     conf = DOMAIN_SCHEMA(config.get(DOMAIN, {}))
     if conf[CONF_LL_HLS]:
         assert isinstance(conf[CONF_SEGMENT_DURATION], float)
@@ -406,7 +415,8 @@ class Stream:
         from .worker import StreamState, StreamWorkerError, stream_worker
 
         stream_state = StreamState(self.hass, self.outputs, self._diagnostics)
-        wait_timeout = 0
+        retry_timeout = 0
+        wait_timeout: float = 0
         while not self._thread_quit.wait(timeout=wait_timeout):
             start_time = time.time()
             self.hass.add_job(self._async_update_state, True)
@@ -425,6 +435,7 @@ class Stream:
                     stream_state,
                     self._keyframe_converter,
                     self._thread_quit,
+                    self.hass.data[DOMAIN][ATTR_SOURCE_OPEN_SEMAPHORE],
                 )
             except StreamWorkerError as err:
                 self._diagnostics.increment("worker_error")
@@ -435,7 +446,7 @@ class Stream:
                 if self._fast_restart_once:
                     # The stream source is updated, restart without any delay and reset the retry
                     # backoff for the new url.
-                    wait_timeout = 0
+                    retry_timeout = wait_timeout = 0
                     self._fast_restart_once = False
                     self._thread_quit.clear()
                     continue
@@ -447,9 +458,12 @@ class Stream:
             # with trying a short wait_timeout and increase it on each reconnection attempt.
             # Reset the wait_timeout after the worker has been up for several minutes
             if time.time() - start_time > STREAM_RESTART_RESET_TIME:
-                wait_timeout = 0
-            wait_timeout += STREAM_RESTART_INCREMENT
-            self._diagnostics.set_value("retry_timeout", wait_timeout)
+                retry_timeout = 0
+            retry_timeout += STREAM_RESTART_INCREMENT
+            self._diagnostics.set_value("retry_timeout", retry_timeout)
+            # Spread the restarts of streams which failed at the same time, e.g.
+            # when a network or NVR went down
+            wait_timeout = retry_timeout + uniform(0, STREAM_RESTART_JITTER)
             self._logger.debug(
                 "Restarting stream worker in %d seconds: %s",
                 wait_timeout,
@@ -3,6 +3,7 @@ DOMAIN = "stream"
 
 ATTR_ENDPOINTS = "endpoints"
 ATTR_SETTINGS = "settings"
+ATTR_SOURCE_OPEN_SEMAPHORE = "source_open_semaphore"
 ATTR_STREAMS = "streams"
 
 HLS_PROVIDER = "hls"
@@ -35,9 +36,12 @@ MAX_TIMESTAMP_GAP = 30  # seconds - anything from 10 to 50000 is probably reason
 
 MAX_MISSING_DTS = 6  # Number of packets missing DTS to allow
 SOURCE_TIMEOUT = 30  # Timeout for reading stream source
+SOURCE_OPEN_TIMEOUT = 10  # Timeout for opening stream source
+MAX_CONCURRENT_SOURCE_OPENS = 4  # Number of stream sources opened at the same time
 
 STREAM_RESTART_INCREMENT = 10  # Increase wait_timeout by this amount each retry
 STREAM_RESTART_RESET_TIME = 300  # Reset wait_timeout after this many seconds
+STREAM_RESTART_JITTER = 5  # Add up to this many seconds to each retry wait_timeout
 
 CONF_LL_HLS = "ll_hls"
 CONF_PART_DURATION = "part_duration"
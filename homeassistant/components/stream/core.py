@@ -76,8 +76,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view of the segment data once it is joined
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -101,6 +101,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Data of all parts, joined once when the segment is complete
+    _data: bytes | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -138,8 +140,24 @@ class Segment:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        """Return reconstructed data for all parts as bytes, without init.
+
+        The parts of a complete segment don't change anymore, their data is only
+        joined once and shared by all viewers. The data of each part is replaced
+        by a view of the joined data, so the part data is not kept twice.
+        """
+        if self._data is not None:
+            return self._data
+        data = b"".join([part.data for part in self.parts])
+        if self.complete:
+            self._data = data
+            view = memoryview(data)
+            offset = 0
+            for part in self.parts:
+                size = len(part.data)
+                part.data = view[offset : offset + size]
+                offset += size
+        return data
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
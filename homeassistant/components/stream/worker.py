@@ -8,7 +8,8 @@ from dataclasses import fields
 import datetime
 from io import SEEK_END, BytesIO
 import logging
-from threading import Event
+from threading import BoundedSemaphore, Event
+import time
 from typing import Any, Self, cast
 
 import av
@@ -24,6 +25,7 @@ from .const import (
     MAX_TIMESTAMP_GAP,
     PACKETS_TO_WAIT_FOR_AUDIO,
     SEGMENT_CONTAINER_FORMAT,
+    SOURCE_OPEN_TIMEOUT,
     SOURCE_TIMEOUT,
 )
 from .core import (
@@ -507,20 +509,38 @@ def stream_worker(
     stream_state: StreamState,
     keyframe_converter: KeyFrameConverter,
     quit_event: Event,
+    source_open_semaphore: BoundedSemaphore,
 ) -> None:
-    """Handle consuming streams."""
+    """Handle consuming streams.
+
+    The source is only opened while holding the source open semaphore, which
+    limits the number of sources being opened at the same time.
+    """
 
     if av.library_versions["libavformat"][0] >= 59 and "stimeout" in pyav_options:
         # the stimeout option was renamed to timeout as of ffmpeg 5.0
         pyav_options["timeout"] = pyav_options["stimeout"]
         del pyav_options["stimeout"]
+    open_start = time.monotonic()
+    while not source_open_semaphore.acquire(timeout=1):
+        if quit_event.is_set():
+            return
     try:
-        container = av.open(source, options=pyav_options, timeout=SOURCE_TIMEOUT)
+        container = av.open(
+            source,
+            options=pyav_options,
+            timeout=(SOURCE_OPEN_TIMEOUT, SOURCE_TIMEOUT),
+        )
     except av.AVError as err:
         raise StreamWorkerError(
             f"Error opening stream ({err.type}, {err.strerror})"
             f" {redact_credentials(str(source))}"
         ) from err
+    finally:
+        source_open_semaphore.release()
+    stream_state.diagnostics.set_value(
+        "open_time", round(time.monotonic() - open_start, 3)
+    )
     try:
         video_stream = container.streams.video[0]
     except (KeyError, IndexError) as ex:
@@ -1,7 +1,8 @@
 """Support for script and automation tracing and debugging."""
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
 import logging
 from typing import Any
 
@@ -13,16 +14,26 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.trace import trace_enabled_cv
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_INTERVAL,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
+    DATA_TRACE_RUNS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_STORED_TRACES,
+    TRACE_MODE_ERRORS,
+    TRACE_MODE_FULL,
+    TRACE_MODE_OFF,
+    TRACE_MODE_SAMPLED,
+    TRACE_MODES,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -34,7 +45,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_MODE, default=TRACE_MODE_FULL): vol.In(TRACE_MODES),
+    vol.Optional(CONF_SAMPLE_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -50,6 +65,7 @@ def _get_data(hass: HomeAssistant) -> TraceData:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_RUNS] = {}
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -151,6 +167,44 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_remove_trace_runs(
+    hass: HomeAssistant, domain: str, item_id: str | None
+) -> None:
+    """Forget how often a script or automation ran when it is removed."""
+    hass.data[DATA_TRACE_RUNS].pop(f"{domain}.{item_id}", None)
+
+
+@contextmanager
+def async_record_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> Generator[None, None, None]:
+    """Record a trace of a script or automation run according to its trace mode.
+
+    Runs which are not recorded do not add any elements to the trace.
+    """
+    stored_traces: int = trace_config[CONF_STORED_TRACES]
+    trace_mode: str = trace_config[CONF_TRACE_MODE]
+    record = trace_mode != TRACE_MODE_OFF
+    if trace_mode == TRACE_MODE_SAMPLED:
+        trace_runs: dict[str, int] = hass.data[DATA_TRACE_RUNS]
+        runs = trace_runs.get(trace.key, 0)
+        trace_runs[trace.key] = runs + 1
+        record = runs % trace_config[CONF_SAMPLE_INTERVAL] == 0
+
+    # Traces of runs which may not fail are only stored when the run finishes
+    if record and trace_mode != TRACE_MODE_ERRORS:
+        async_store_trace(hass, trace, stored_traces)
+
+    token = trace_enabled_cv.set(record)
+    try:
+        yield
+    finally:
+        trace_enabled_cv.reset(token)
+        if trace_mode == TRACE_MODE_ERRORS and trace.failed:
+            async_store_trace(hass, trace, stored_traces)
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
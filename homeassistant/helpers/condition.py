@@ -247,11 +247,45 @@ async def async_from_config(
     return cast(ConditionCheckerType, factory(config))
 
 
+def _condition_cost(config: ConfigType) -> int:
+    """Return the relative cost of checking a condition."""
+    condition = config.get(CONF_CONDITION)
+    if condition in ("and", "not", "or"):
+        return max(
+            (_condition_cost(entry) for entry in config["conditions"]), default=0
+        )
+    if condition == "template" or CONF_VALUE_TEMPLATE in config:
+        return 2
+    if condition == "device":
+        return 1
+    return 0
+
+
+def _check_order(configs: list[ConfigType]) -> list[tuple[int, list[str]]]:
+    """Return the order in which to check a list of conditions.
+
+    The result of 'and', 'or' and 'not' conditions does not depend on the order
+    in which their conditions are checked, so cheap conditions are checked before
+    conditions which render templates to allow skipping the latter.
+    """
+    costs = [_condition_cost(entry) for entry in configs]
+    return [
+        (index, ["conditions", str(index)])
+        for index in sorted(range(len(configs)), key=costs.__getitem__)
+    ]
+
+
+def _sort_errors(errors: list[ConditionErrorIndex]) -> list[ConditionErrorIndex]:
+    """Sort errors of a multi condition by the index of the failed condition."""
+    return sorted(errors, key=lambda error: error.index)
+
+
 async def async_and_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    check_order = _check_order(config["conditions"])
 
     @trace_condition_function
     def if_and_condition(
@@ -259,10 +293,10 @@ async def async_and_from_config(
     ) -> bool:
         """Test and condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, path in check_order:
             try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is False:
+                with trace_path(path):
+                    if checks[index](hass, variables) is False:
                         return False
             except ConditionError as ex:
                 errors.append(
@@ -271,7 +305,7 @@ async def async_and_from_config(
 
         # Raise the errors if no check was false
         if errors:
-            raise ConditionErrorContainer("and", errors=errors)
+            raise ConditionErrorContainer("and", errors=_sort_errors(errors))
 
         return True
 
@@ -283,6 +317,7 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    check_order = _check_order(config["conditions"])
 
     @trace_condition_function
     def if_or_condition(
@@ -290,10 +325,10 @@ async def async_or_from_config(
     ) -> bool:
         """Test or condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, path in check_order:
             try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is True:
+                with trace_path(path):
+                    if checks[index](hass, variables) is True:
                         return True
             except ConditionError as ex:
                 errors.append(
@@ -302,7 +337,7 @@ async def async_or_from_config(
 
         # Raise the errors if no check was true
         if errors:
-            raise ConditionErrorContainer("or", errors=errors)
+            raise ConditionErrorContainer("or", errors=_sort_errors(errors))
 
         return False
 
@@ -314,6 +349,7 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    check_order = _check_order(config["conditions"])
 
     @trace_condition_function
     def if_not_condition(
@@ -321,10 +357,10 @@ async def async_not_from_config(
     ) -> bool:
         """Test not condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, path in check_order:
             try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables):
+                with trace_path(path):
+                    if checks[index](hass, variables):
                         return False
             except ConditionError as ex:
                 errors.append(
@@ -333,7 +369,7 @@ async def async_not_from_config(
 
         # Raise the errors if no check was true
         if errors:
-            raise ConditionErrorContainer("not", errors=errors)
+            raise ConditionErrorContainer("not", errors=_sort_errors(errors))
 
         return True
 
@@ -2,16 +2,32 @@
 from __future__ import annotations
 
 from collections.abc import Coroutine
+import hashlib
+import time
 from typing import Any, NamedTuple
 
+from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import CoreState, Event, HomeAssistant, callback
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.data_entry_flow import FlowResult, FlowResultType
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import gather_with_limited_concurrency
 
+from .dispatcher import async_dispatcher_connect
+from .storage import Store
+
 FLOW_INIT_LIMIT = 2
 DISCOVERY_FLOW_DISPATCHER = "discovery_flow_dispatcher"
+DISCOVERY_FLOW_CACHE = "discovery_flow_cache"
+
+STORAGE_KEY = "core.discovery_flow_cache"
+STORAGE_VERSION = 1
+CACHE_SAVE_DELAY = 60
+CACHE_TTL = 86400  # seconds
+
+# Sources that announce the same discovery data every time
+# the device is seen, so a fingerprint of the data can be reused
+CACHED_SOURCES = {config_entries.SOURCE_DHCP, config_entries.SOURCE_ZEROCONF}
 
 
 @bind_hass
@@ -50,9 +66,157 @@ def _async_init_flow(
     ):
         return None
 
+    if (
+        context["source"] in CACHED_SOURCES
+        and (cache := hass.data.get(DISCOVERY_FLOW_CACHE)) is not None
+    ):
+        # Avoid probing devices again that were already configured
+        # or ignored when they were discovered with the same data
+        fingerprint = _async_discovery_fingerprint(context["source"], data)
+        if cache.async_is_configured(domain, fingerprint):
+            return None
+        return _async_init_flow_and_cache(
+            hass, cache, domain, context, data, fingerprint
+        )
+
     return hass.config_entries.flow.async_init(domain, context=context, data=data)
 
 
+async def _async_init_flow_and_cache(
+    hass: HomeAssistant,
+    cache: DiscoveryFlowCache,
+    domain: str,
+    context: dict[str, Any],
+    data: Any,
+    fingerprint: str,
+) -> FlowResult:
+    """Create a discovery flow and remember if it was already configured."""
+    result = await hass.config_entries.flow.async_init(
+        domain, context=context, data=data
+    )
+    if (
+        result["type"] == FlowResultType.ABORT
+        and result["reason"] == "already_configured"
+    ):
+        cache.async_set_configured(domain, fingerprint)
+    return result
+
+
+@callback
+def _async_discovery_fingerprint(source: str, data: Any) -> str:
+    """Return a fingerprint of the discovery source and data."""
+    return hashlib.sha256(repr((source, data)).encode()).hexdigest()
+
+
+@callback
+def _async_entry_fingerprint(entry: config_entries.ConfigEntry) -> str:
+    """Return a fingerprint of what a discovery flow may update in an entry."""
+    return hashlib.sha256(repr((entry.unique_id, entry.data)).encode()).hexdigest()
+
+
+class DiscoveryFlowCache:
+    """Remember discoveries that were already configured.
+
+    Discovery integrations find every device again on each start,
+    which would run the discovery steps of all configured and ignored
+    devices again. The result is stored so these flows can be skipped
+    as long as the discovery data has not changed.
+
+    The discoveries of a domain are forgotten when one of its entries is
+    removed or its unique id or data change, e.g. when a flow updated the
+    host of a device that moved. Otherwise a device moving back to an
+    address it was discovered with before would not update the entry.
+
+    The cache is not used for a domain while one of its entries is waiting
+    to retry its setup, since discovering the device again reloads it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init the discovery flow cache."""
+        self.hass = hass
+        self._store = Store[dict[str, dict[str, float]]](
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._configured: dict[str, dict[str, float]] = {}
+        self._entries: dict[str, str] = {}
+
+    async def async_load(self) -> None:
+        """Load the cache and drop expired entries."""
+        if data := await self._store.async_load():
+            now = time.time()
+            self._configured = {
+                domain: remaining
+                for domain, fingerprints in data.items()
+                if (
+                    remaining := {
+                        fingerprint: expires
+                        for fingerprint, expires in fingerprints.items()
+                        if expires > now
+                    }
+                )
+            }
+        self._entries = {
+            entry.entry_id: _async_entry_fingerprint(entry)
+            for entry in self.hass.config_entries.async_entries()
+        }
+        async_dispatcher_connect(
+            self.hass,
+            config_entries.SIGNAL_CONFIG_ENTRY_CHANGED,
+            self._async_config_entry_changed,
+        )
+
+    @callback
+    def _async_config_entry_changed(
+        self,
+        change: config_entries.ConfigEntryChange,
+        entry: config_entries.ConfigEntry,
+    ) -> None:
+        """Forget the discoveries of a domain when one of its entries changed."""
+        if change is config_entries.ConfigEntryChange.REMOVED:
+            self._entries.pop(entry.entry_id, None)
+        else:
+            fingerprint = _async_entry_fingerprint(entry)
+            previous = self._entries.get(entry.entry_id)
+            self._entries[entry.entry_id] = fingerprint
+            # Entries being added or their state changing does not
+            # change which discoveries were already configured
+            if change is config_entries.ConfigEntryChange.ADDED or (
+                previous == fingerprint
+            ):
+                return
+        if self._configured.pop(entry.domain, None):
+            self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+
+    @callback
+    def async_is_configured(self, domain: str, fingerprint: str) -> bool:
+        """Return if the discovery was already configured."""
+        if (fingerprints := self._configured.get(domain)) is None or (
+            expires := fingerprints.get(fingerprint)
+        ) is None:
+            return False
+        if expires <= time.time():
+            del fingerprints[fingerprint]
+            if not fingerprints:
+                del self._configured[domain]
+            self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+            return False
+        return not any(
+            entry.state is config_entries.ConfigEntryState.SETUP_RETRY
+            for entry in self.hass.config_entries.async_entries(domain)
+        )
+
+    @callback
+    def async_set_configured(self, domain: str, fingerprint: str) -> None:
+        """Remember the discovery was already configured."""
+        self._configured.setdefault(domain, {})[fingerprint] = time.time() + CACHE_TTL
+        self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, float]]:
+        """Return data of the cache to store in a file."""
+        return self._configured
+
+
 class PendingFlowKey(NamedTuple):
     """Key for pending flows."""
 
@@ -83,6 +247,9 @@ class FlowDispatcher:
 
     async def _async_start(self, event: Event) -> None:
         """Start processing pending flows."""
+        cache = DiscoveryFlowCache(self.hass)
+        await cache.async_load()
+        self.hass.data[DISCOVERY_FLOW_CACHE] = cache
         pending_flows = self.pending_flows
         self.pending_flows = {}
         self.started = True
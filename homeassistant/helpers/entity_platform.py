@@ -345,11 +345,12 @@ class EntityPlatform:
 
                 # Block till all entities are done
                 while self._tasks:
-                    pending = [task for task in self._tasks if not task.done()]
+                    # Entities added without an update usually finish before
+                    # we get here, gather them anyway so their exceptions
+                    # are retrieved.
+                    tasks = self._tasks.copy()
                     self._tasks.clear()
-
-                    if pending:
-                        await asyncio.gather(*pending)
+                    await asyncio.gather(*tasks)
 
                 hass.config.components.add(full_name)
                 self._setup_complete = True
@@ -504,6 +505,51 @@ class EntityPlatform:
             self.hass.loop,
         ).result()
 
+    async def _async_add_and_update_entities(
+        self,
+        coros: list[Coroutine[Any, Any, None]],
+        timeout: float,
+    ) -> None:
+        """Add entities for a single platform and update them.
+
+        Since we are going to update the entities before adding them
+        we need to gather them to ensure that they are updated in parallel.
+        """
+        async with self.hass.timeout.async_timeout(timeout, self.domain):
+            await asyncio.gather(*coros)
+
+    async def _async_add_entities(
+        self,
+        coros: list[Coroutine[Any, Any, None]],
+        timeout: float,
+    ) -> None:
+        """Add entities for a single platform without updating.
+
+        In this case we are not updating the entities before adding them
+        which means it is unlikely that we will have to yield control
+        to the event loop, so we can await the coros one after another
+        without scheduling a task for each of them.
+
+        If adding an entity fails, the remaining entities are still added
+        and the first exception is raised once all coros have run.
+        """
+        first_exception: BaseException | None = None
+        remaining_coros = iter(coros)
+        try:
+            async with self.hass.timeout.async_timeout(timeout, self.domain):
+                for coro in remaining_coros:
+                    try:
+                        await coro
+                    except Exception as ex:  # pylint: disable=broad-except
+                        if first_exception is None:
+                            first_exception = ex
+        finally:
+            # Close the coros that were not awaited when we timed out
+            for coro in remaining_coros:
+                coro.close()
+        if first_exception is not None:
+            raise first_exception
+
     async def async_add_entities(
         self, new_entities: Iterable[Entity], update_before_add: bool = False
     ) -> None:
@@ -518,19 +564,23 @@ class EntityPlatform:
         hass = self.hass
 
         entity_registry = ent_reg.async_get(hass)
-        tasks = [
+        coros = [
             self._async_add_entity(entity, update_before_add, entity_registry)
             for entity in new_entities
         ]
 
         # No entities for processing
-        if not tasks:
+        if not coros:
             return
 
-        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(tasks), SLOW_ADD_MIN_TIMEOUT)
+        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(coros), SLOW_ADD_MIN_TIMEOUT)
+        if update_before_add:
+            add_func = self._async_add_and_update_entities
+        else:
+            add_func = self._async_add_entities
+
         try:
-            async with self.hass.timeout.async_timeout(timeout, self.domain):
-                await asyncio.gather(*tasks)
+            await add_func(coros, timeout)
         except TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
 import logging
+import math
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypedDict, TypeVar
@@ -16,6 +17,7 @@ import attr
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
@@ -23,6 +25,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -63,6 +66,11 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+COARSE_TIMERS = "coarse_timers"
+
+# Resolution in seconds of timers scheduled with async_call_later_coarse
+COARSE_TIMER_RESOLUTION = 1
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1509,6 +1517,125 @@ def async_call_later(
 call_later = threaded_listener_factory(async_call_later)
 
 
+class _CoarseTimers:
+    """Coalesce coarse timers which expire in the same tick into one loop timer.
+
+    Timers are grouped in buckets of COARSE_TIMER_RESOLUTION seconds, the event
+    loop only holds a single timer for each bucket which is in use. All timers
+    are cancelled when Home Assistant stops.
+    """
+
+    __slots__ = ("hass", "_buckets", "_handles")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coarse timers."""
+        self.hass = hass
+        self._buckets: dict[
+            int, dict[object, HassJob[[datetime], Coroutine[Any, Any, None] | None]]
+        ] = {}
+        self._handles: dict[int, asyncio.TimerHandle] = {}
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_cancel_all)
+
+    @callback
+    def async_schedule(
+        self,
+        loop_time: float,
+        job: HassJob[[datetime], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Schedule a job to run at the end of the tick of loop_time."""
+        tick = math.ceil(loop_time / COARSE_TIMER_RESOLUTION)
+        if (bucket := self._buckets.get(tick)) is None:
+            bucket = self._buckets[tick] = {}
+            self._handles[tick] = self.hass.loop.call_at(
+                tick * COARSE_TIMER_RESOLUTION, self._async_run_bucket, tick
+            )
+        token = object()
+        bucket[token] = job
+        return ft.partial(self._async_cancel, tick, token)
+
+    @callback
+    def _async_cancel(self, tick: int, token: object) -> None:
+        """Cancel a scheduled job."""
+        if (bucket := self._buckets.get(tick)) is None or token not in bucket:
+            return
+        del bucket[token]
+        if not bucket:
+            del self._buckets[tick]
+            self._handles.pop(tick).cancel()
+
+    @callback
+    def _async_cancel_all(self, _: Event) -> None:
+        """Cancel all scheduled jobs."""
+        for handle in self._handles.values():
+            handle.cancel()
+        self._handles.clear()
+        self._buckets.clear()
+
+    @callback
+    def _async_run_bucket(self, tick: int) -> None:
+        """Run all jobs of a tick."""
+        del self._handles[tick]
+        bucket = self._buckets.pop(tick)
+        utc_now = time_tracker_utcnow()
+        for job in bucket.values():
+            try:
+                self.hass.async_run_hass_job(job, utc_now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running coarse timer %s", job)
+
+    @callback
+    def async_pending_by_owner(self) -> dict[str, int]:
+        """Return the number of pending timers by owner."""
+        pending: dict[str, int] = {}
+        for bucket in self._buckets.values():
+            for job in bucket.values():
+                owner = job.name or ""
+                pending[owner] = pending.get(owner, 0) + 1
+        return pending
+
+
+@callback
+def _async_get_coarse_timers(hass: HomeAssistant) -> _CoarseTimers:
+    """Return the coarse timers of a Home Assistant instance."""
+    if (coarse_timers := hass.data.get(COARSE_TIMERS)) is None:
+        coarse_timers = hass.data[COARSE_TIMERS] = _CoarseTimers(hass)
+    return coarse_timers  # type: ignore[no-any-return]
+
+
+@callback
+@bind_hass
+def async_call_later_coarse(
+    hass: HomeAssistant,
+    delay: float | timedelta,
+    action: Callable[[datetime], Coroutine[Any, Any, None] | None],
+    *,
+    name: str,
+) -> CALLBACK_TYPE:
+    """Add a listener that fires at or up to COARSE_TIMER_RESOLUTION after <delay>.
+
+    Listeners which fire in the same tick share a single event loop timer, which
+    makes this cheaper than async_call_later for large numbers of timers which
+    can tolerate the jitter. The timers are cancelled when Home Assistant stops.
+
+    The name identifies the owner of the timer in async_get_coarse_timers_by_owner.
+    The listener is passed the time it fires in UTC time.
+    """
+    if isinstance(delay, timedelta):
+        delay = delay.total_seconds()
+    return _async_get_coarse_timers(hass).async_schedule(
+        hass.loop.time() + delay, HassJob(action, name)
+    )
+
+
+@callback
+@bind_hass
+def async_get_coarse_timers_by_owner(hass: HomeAssistant) -> dict[str, int]:
+    """Return the number of pending coarse timers by owner name."""
+    if (coarse_timers := hass.data.get(COARSE_TIMERS)) is None:
+        return {}
+    return coarse_timers.async_pending_by_owner()  # type: ignore[no-any-return]
+
+
 @dataclass(slots=True)
 class _TrackTimeInterval:
     """Helper class to help listen to time interval events."""
@@ -0,0 +1,96 @@
+"""Helper to index the ids referenced by the entities of a domain."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Protocol
+
+from homeassistant.core import HomeAssistant, callback
+
+REFERENCED_PROPERTIES = (
+    "referenced_areas",
+    "referenced_devices",
+    "referenced_entities",
+)
+REFERENCED_BLUEPRINT = "referenced_blueprint"
+
+
+class ReferencingEntity(Protocol):
+    """An entity which references areas, devices, entities and a blueprint."""
+
+    entity_id: str
+
+    @property
+    def referenced_areas(self) -> set[str]:
+        """Return a set of referenced areas."""
+
+    @property
+    def referenced_devices(self) -> set[str]:
+        """Return a set of referenced devices."""
+
+    @property
+    def referenced_entities(self) -> set[str]:
+        """Return a set of referenced entities."""
+
+    @property
+    def referenced_blueprint(self) -> str | None:
+        """Return referenced blueprint or None."""
+
+    def async_on_remove(self, func: Callable[[], None]) -> None:
+        """Add a function to call when the entity is removed."""
+
+
+@callback
+def async_get_referencing_entity_ids(
+    hass: HomeAssistant,
+    data_key: str,
+    entities: Iterable[ReferencingEntity],
+    property_name: str,
+    referenced_id: str,
+) -> list[str]:
+    """Return the ids of the entities that reference an id.
+
+    The index of the entities is stored under the data key, it is built
+    on first use and dropped whenever one of the entities is added or
+    removed, since the references of an entity do not change while it
+    is added.
+    """
+    if (references := hass.data.get(data_key)) is None:
+        references = hass.data[data_key] = _build_reference_index(entities)
+    return list(references[property_name].get(referenced_id, ()))
+
+
+def _build_reference_index(
+    entities: Iterable[ReferencingEntity],
+) -> dict[str, dict[str, list[str]]]:
+    """Build an index of referenced ids to the entities referencing them."""
+    references: dict[str, dict[str, list[str]]] = {
+        property_name: {}
+        for property_name in (*REFERENCED_PROPERTIES, REFERENCED_BLUEPRINT)
+    }
+    for entity in entities:
+        entity_id = entity.entity_id
+        for property_name in REFERENCED_PROPERTIES:
+            index = references[property_name]
+            for referenced_id in getattr(entity, property_name):
+                index.setdefault(referenced_id, []).append(entity_id)
+        if (blueprint_path := entity.referenced_blueprint) is not None:
+            references[REFERENCED_BLUEPRINT].setdefault(blueprint_path, []).append(
+                entity_id
+            )
+    return references
+
+
+@callback
+def async_drop_reference_index(hass: HomeAssistant, data_key: str) -> None:
+    """Drop the index stored under the data key."""
+    hass.data.pop(data_key, None)
+
+
+@callback
+def async_track_entity_references(
+    hass: HomeAssistant, data_key: str, entity: ReferencingEntity
+) -> None:
+    """Drop the index when the entity is added and when it is removed."""
+    async_drop_reference_index(hass, data_key)
+    entity.async_on_remove(partial(async_drop_reference_index, hass, data_key))
@@ -471,7 +471,7 @@ class _ScriptRun:
                 if self._stop.is_set():
                     return
 
-                action = cv.determine_script_action(self._action)
+                action, handler = self._script.step_handlers[self._step]
 
                 if not self._action.get(CONF_ENABLED, True):
                     self._log(
@@ -481,7 +481,6 @@ class _ScriptRun:
                     return
 
                 try:
-                    handler = f"_async_{action}_step"
                     await getattr(self, handler)()
                 except Exception as ex:  # pylint: disable=broad-except
                     self._handle_exception(
@@ -1254,6 +1253,13 @@ class Script:
         variables: ScriptVariables | None = None,
     ) -> None:
         """Initialize the script."""
+        # Resolve the action type and handler of each step once, instead of
+        # on every run of the step, before the script is registered since
+        # an unknown action type raises
+        self.step_handlers: list[tuple[str, str]] = [
+            (action, f"_async_{action}_step")
+            for action in map(cv.determine_script_action, sequence)
+        ]
         if not (all_scripts := hass.data.get(DATA_SCRIPTS)):
             all_scripts = hass.data[DATA_SCRIPTS] = []
             hass.bus.async_listen_once(
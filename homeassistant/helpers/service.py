@@ -179,6 +179,10 @@ _SERVICE_SCHEMA = vol.Schema(
 
 _SERVICES_SCHEMA = vol.Schema({cv.slug: vol.Any(None, _SERVICE_SCHEMA)})
 
+# Calling a bare vol.Any compiles its validators on every call, wrap it in a
+# schema to compile it once
+_COMP_ENTITY_IDS_OR_UUIDS = vol.Schema(cv.comp_entity_ids_or_uuids)
+
 
 class ServiceParams(TypedDict):
     """Type for service call parameters."""
@@ -341,7 +345,7 @@ def async_prepare_call_from_config(
 
             if CONF_ENTITY_ID in target:
                 registry = entity_registry.async_get(hass)
-                entity_ids = cv.comp_entity_ids_or_uuids(target[CONF_ENTITY_ID])
+                entity_ids = _COMP_ENTITY_IDS_OR_UUIDS(target[CONF_ENTITY_ID])
                 if entity_ids not in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE):
                     entity_ids = entity_registry.async_validate_entity_ids(
                         registry, entity_ids
@@ -5,6 +5,8 @@ from collections.abc import Callable
 import datetime
 from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
+
 from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.loader import bind_hass
@@ -15,11 +17,16 @@ if TYPE_CHECKING:
     import astral.location
 
 DATA_LOCATION_CACHE = "astral_location_cache"
+DATA_ASTRAL_EVENT_CACHE = "astral_event_cache"
 
 ELEVATION_AGNOSTIC_EVENTS = ("noon", "midnight")
 
 _AstralSunEventCallable = Callable[..., datetime.datetime]
 
+# Sun events of a location only change once a day, cache them so sun conditions,
+# triggers and templates using the same event don't need to calculate it again
+_ASTRAL_EVENT_CACHE_SIZE = 512
+
 
 @callback
 @bind_hass
@@ -46,6 +53,61 @@ def get_astral_location(
     return hass.data[DATA_LOCATION_CACHE][info], elevation
 
 
+@callback
+def _get_astral_event_cache(
+    hass: HomeAssistant,
+) -> LRU[tuple[Any, ...], datetime.datetime]:
+    """Get the cache of sun events for Home Assistant."""
+    if DATA_ASTRAL_EVENT_CACHE not in hass.data:
+        hass.data[DATA_ASTRAL_EVENT_CACHE] = LRU(_ASTRAL_EVENT_CACHE_SIZE)
+
+    return cast(
+        "LRU[tuple[Any, ...], datetime.datetime]", hass.data[DATA_ASTRAL_EVENT_CACHE]
+    )
+
+
+def _get_location_astral_event(
+    location: astral.location.Location,
+    elevation: astral.Elevation,
+    event: str,
+    date: datetime.date,
+    event_cache: LRU[tuple[Any, ...], datetime.datetime] | None,
+) -> datetime.datetime:
+    """Calculate the specified solar event for a date.
+
+    The event is looked up in and stored to the event cache, if one is passed.
+    """
+    if event_cache is None:
+        return _calculate_location_astral_event(location, elevation, event, date)
+    key = (
+        location.latitude,
+        location.longitude,
+        location.timezone,
+        location.solar_depression,
+        elevation,
+        event,
+        date,
+    )
+    if (event_dt := event_cache.get(key)) is None:
+        event_dt = event_cache[key] = _calculate_location_astral_event(
+            location, elevation, event, date
+        )
+    return event_dt
+
+
+def _calculate_location_astral_event(
+    location: astral.location.Location,
+    elevation: astral.Elevation,
+    event: str,
+    date: datetime.date,
+) -> datetime.datetime:
+    """Calculate the specified solar event for a date without the cache."""
+    kwargs: dict[str, Any] = {"local": False}
+    if event not in ELEVATION_AGNOSTIC_EVENTS:
+        kwargs["observer_elevation"] = elevation
+    return cast(_AstralSunEventCallable, getattr(location, event))(date, **kwargs)
+
+
 @callback
 @bind_hass
 def get_astral_event_next(
@@ -56,8 +118,13 @@ def get_astral_event_next(
 ) -> datetime.datetime:
     """Calculate the next specified solar event."""
     location, elevation = get_astral_location(hass)
-    return get_location_astral_event_next(
-        location, elevation, event, utc_point_in_time, offset
+    return _get_location_astral_event_next(
+        location,
+        elevation,
+        event,
+        utc_point_in_time,
+        offset,
+        _get_astral_event_cache(hass),
     )
 
 
@@ -70,6 +137,20 @@ def get_location_astral_event_next(
     offset: datetime.timedelta | None = None,
 ) -> datetime.datetime:
     """Calculate the next specified solar event."""
+    return _get_location_astral_event_next(
+        location, elevation, event, utc_point_in_time, offset, None
+    )
+
+
+def _get_location_astral_event_next(
+    location: astral.location.Location,
+    elevation: astral.Elevation,
+    event: str,
+    utc_point_in_time: datetime.datetime | None,
+    offset: datetime.timedelta | None,
+    event_cache: LRU[tuple[Any, ...], datetime.datetime] | None,
+) -> datetime.datetime:
+    """Calculate the next specified solar event using the event cache."""
 
     if offset is None:
         offset = datetime.timedelta()
@@ -77,19 +158,18 @@ def get_location_astral_event_next(
     if utc_point_in_time is None:
         utc_point_in_time = dt_util.utcnow()
 
-    kwargs: dict[str, Any] = {"local": False}
-    if event not in ELEVATION_AGNOSTIC_EVENTS:
-        kwargs["observer_elevation"] = elevation
-
+    local_date = dt_util.as_local(utc_point_in_time).date()
     mod = -1
     first_err = None
     while mod < 367:
         try:
             next_dt = (
-                cast(_AstralSunEventCallable, getattr(location, event))(
-                    dt_util.as_local(utc_point_in_time).date()
-                    + datetime.timedelta(days=mod),
-                    **kwargs,
+                _get_location_astral_event(
+                    location,
+                    elevation,
+                    event,
+                    local_date + datetime.timedelta(days=mod),
+                    event_cache,
                 )
                 + offset
             )
@@ -120,12 +200,10 @@ def get_astral_event_date(
     if isinstance(date, datetime.datetime):
         date = dt_util.as_local(date).date()
 
-    kwargs: dict[str, Any] = {"local": False}
-    if event not in ELEVATION_AGNOSTIC_EVENTS:
-        kwargs["observer_elevation"] = elevation
-
     try:
-        return cast(_AstralSunEventCallable, getattr(location, event))(date, **kwargs)
+        return _get_location_astral_event(
+            location, elevation, event, date, _get_astral_event_cache(hass)
+        )
     except ValueError:
         # Event never occurs for specified date.
         return None
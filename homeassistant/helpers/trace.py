@@ -21,6 +21,7 @@ class TraceElement:
     """Container for trace data."""
 
     __slots__ = (
+        "_changed_variables",
         "_child_key",
         "_child_run_id",
         "_error",
@@ -43,6 +44,8 @@ class TraceElement:
         self._timestamp = dt_util.utcnow()
 
         self._last_variables = variables_cv.get() or {}
+        self._variables: dict[str, Any] = {}
+        self._changed_variables: dict[str, Any] | None = None
         self.update_variables(variables)
 
     def __repr__(self) -> str:
@@ -68,17 +71,27 @@ class TraceElement:
         self._result = {**old_result, **kwargs}
 
     def update_variables(self, variables: TemplateVarsType) -> None:
-        """Update variables."""
-        if variables is None:
-            variables = {}
-        last_variables = self._last_variables
-        variables_cv.set(dict(variables))
-        changed_variables = {
-            key: value
-            for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
-        }
-        self._variables = changed_variables
+        """Update variables.
+
+        Only a shallow copy of the variables is taken here, the changed
+        variables are worked out when the trace element is serialized.
+        """
+        if not trace_enabled_cv.get():
+            return
+        self._variables = dict(variables) if variables is not None else {}
+        self._changed_variables = None
+        variables_cv.set(self._variables)
+
+    def _get_changed_variables(self) -> dict[str, Any]:
+        """Return the variables which changed compared to the previous element."""
+        if self._changed_variables is None:
+            last_variables = self._last_variables
+            self._changed_variables = {
+                key: value
+                for key, value in self._variables.items()
+                if key not in last_variables or last_variables[key] != value
+            }
+        return self._changed_variables
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
@@ -90,8 +103,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
-        if self._variables:
-            result["changed_variables"] = self._variables
+        if changed_variables := self._get_changed_variables():
+            result["changed_variables"] = changed_variables
         if self._error is not None:
             result["error"] = str(self._error) or self._error.__class__.__name__
         if self._result is not None:
@@ -114,6 +127,8 @@ trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
 )
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
+# Whether elements should be recorded in the current trace
+trace_enabled_cv: ContextVar[bool] = ContextVar("trace_enabled_cv", default=True)
 # (domain.item_id, Run ID)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
@@ -183,6 +198,8 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if not trace_enabled_cv.get():
+        return
     if (trace := trace_cv.get()) is None:
         trace = {}
         trace_cv.set(trace)
@@ -0,0 +1,99 @@
+"""Helper to reuse validated configs which did not change since they were validated."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, Protocol, TypeVar
+
+from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+
+from . import device_registry as dr, entity_registry as er
+from .dispatcher import async_dispatcher_connect
+
+DATA_VALIDATED_CONFIGS = "validated_configs"
+
+
+class _ValidatedConfig(Protocol):
+    """A validated config which knows if validation failed."""
+
+    validation_failed: bool
+
+
+_ValidatedConfigT = TypeVar("_ValidatedConfigT", bound=_ValidatedConfig)
+
+
+class ValidatedConfigCache(Generic[_ValidatedConfigT]):
+    """Configs of a domain from the previous validation, keyed by raw config.
+
+    The result of validating a config can depend on the entity and device
+    registries and on config entries, the configs of all domains are dropped
+    when those change. Registry entries being created can not change the
+    result of a validation which succeeded, and do not drop the configs.
+    """
+
+    def __init__(self, hass: HomeAssistant, domain: str) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._domain = domain
+        self._previous_configs: dict[str, _ValidatedConfigT] = _async_get_domains(
+            hass
+        ).setdefault(domain, {})
+        self._validated_configs: dict[str, _ValidatedConfigT] = {}
+
+    async def async_get_or_validate(
+        self,
+        raw_config: Any,
+        validate: Callable[[], Awaitable[_ValidatedConfigT | None]],
+    ) -> _ValidatedConfigT | None:
+        """Return the config from the previous validation or validate it.
+
+        Configs that failed validation are never reused.
+        """
+        config_key = repr(raw_config)
+        if (config := self._previous_configs.get(config_key)) is None:
+            config = await validate()
+        if config is not None and not config.validation_failed:
+            self._validated_configs[config_key] = config
+        return config
+
+    @callback
+    def async_store(self) -> None:
+        """Store the configs for the next validation.
+
+        Configs which were used or validated since the cache was created
+        replace the previous configs, unless they were dropped meanwhile.
+        """
+        domains = _async_get_domains(self._hass)
+        if domains.get(self._domain) is self._previous_configs:
+            domains[self._domain] = self._validated_configs
+
+
+@callback
+def _async_registry_entry_changed_filter(event: Event) -> bool:
+    """Filter registry events for entries which were updated or removed."""
+    return event.data["action"] != "create"
+
+
+@callback
+def _async_get_domains(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the validated configs of all domains."""
+    if DATA_VALIDATED_CONFIGS not in hass.data:
+
+        @callback
+        def _async_drop_validated_configs(*_: Any) -> None:
+            hass.data[DATA_VALIDATED_CONFIGS] = {}
+
+        for event_type in (
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(
+                event_type,
+                _async_drop_validated_configs,
+                event_filter=_async_registry_entry_changed_filter,
+            )
+        async_dispatcher_connect(
+            hass, SIGNAL_CONFIG_ENTRY_CHANGED, _async_drop_validated_configs
+        )
+        hass.data[DATA_VALIDATED_CONFIGS] = {}
+    return hass.data[DATA_VALIDATED_CONFIGS]  # type: ignore[no-any-return]
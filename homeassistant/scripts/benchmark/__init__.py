@@ -13,6 +13,12 @@ from typing import TypeVar
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import (
+    condition,
+    config_validation as cv,
+    entity_registry as er,
+    script,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -314,6 +320,139 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def evaluate_conditions(hass):
+    """Evaluate a typical multi condition automation condition 10k times."""
+    config = cv.CONDITION_SCHEMA(
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "template",
+                    "value_template": "{{ states('sensor.lux') | int < 20 }}",
+                },
+                {
+                    "condition": "state",
+                    "entity_id": "binary_sensor.motion",
+                    "state": "on",
+                },
+                {
+                    "condition": "numeric_state",
+                    "entity_id": "sensor.lux",
+                    "below": 20,
+                },
+                {
+                    "condition": "or",
+                    "conditions": [
+                        {
+                            "condition": "state",
+                            "entity_id": "light.hall",
+                            "state": "off",
+                        },
+                        {"condition": "time", "after": "22:00:00"},
+                    ],
+                },
+            ],
+        }
+    )
+    check = await condition.async_from_config(hass, config)
+    hass.states.async_set("binary_sensor.motion", "off")
+    hass.states.async_set("sensor.lux", "10")
+    hass.states.async_set("light.hall", "off")
+
+    start = timer()
+    for _ in range(10**4):
+        check(hass)
+    return timer() - start
+
+
+@benchmark
+async def run_script(hass):
+    """Run a typical light control script 10k times."""
+    calls = 0
+
+    @core.callback
+    def service_handler(_):
+        """Handle service call."""
+        nonlocal calls
+        calls += 1
+
+    await er.async_load(hass)
+    hass.services.async_register("light", "turn_on", service_handler)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "condition": "state",
+                "entity_id": "binary_sensor.motion",
+                "state": "on",
+            },
+            {
+                "variables": {
+                    "brightness": "{{ 255 if is_state('sun.sun', 'below_horizon') else 128 }}"
+                }
+            },
+            {
+                "service": "light.turn_on",
+                "target": {"entity_id": "light.hall"},
+                "data": {"brightness": "{{ brightness }}", "transition": 2},
+            },
+            {
+                "service": "light.turn_on",
+                "target": {"entity_id": ["light.kitchen", "light.living_room"]},
+                "data": {"brightness": 255},
+            },
+        ]
+    )
+    bench_script = script.Script(
+        hass, sequence, "Benchmark", "script", script_mode="parallel", max_runs=10
+    )
+    hass.states.async_set("binary_sensor.motion", "on")
+    hass.states.async_set("sun.sun", "below_horizon")
+
+    start = timer()
+    for _ in range(10**4):
+        await bench_script.async_run(context=core.Context())
+    assert calls == 2 * 10**4
+    return timer() - start
+
+
+@benchmark
+async def ssdp_matching_domains(hass):
+    """Match a stream of 100k SSDP discoveries against the integration matchers."""
+    # pylint: disable-next=import-outside-toplevel
+    from async_upnp_client.utils import CaseInsensitiveDict
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import ssdp
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.ssdp import SSDP
+
+    matchers = ssdp.IntegrationMatchers()
+    matchers.async_setup(SSDP)
+    headers = {
+        "ST": "upnp:rootdevice",
+        "USN": "uuid:6bd5eabd-b7c8-4f7b-ae6c-a30ccdeb5988::upnp:rootdevice",
+        "location": "http://192.168.1.5:1400/xml/device_description.xml",
+        "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+        "manufacturer": "Unknown",
+        "modelName": "Unknown",
+    }
+    # Every integration device plus as many devices nobody is interested in
+    discoveries = [
+        CaseInsensitiveDict({**headers, **matcher})
+        for integration_matchers in SSDP.values()
+        for matcher in integration_matchers
+    ]
+    discoveries += [CaseInsensitiveDict(headers) for _ in discoveries]
+
+    start = timer()
+    for _ in range(10**5 // len(discoveries)):
+        for discovery in discoveries:
+            matchers.async_matching_domains(discovery)
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
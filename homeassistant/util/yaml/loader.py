@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
-from contextlib import suppress
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
@@ -309,11 +308,14 @@ def _add_reference(  # type: ignore[no-untyped-def]
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
-    if isinstance(obj, str):
+    elif isinstance(obj, str):
         obj = NodeStrClass(obj)
-    with suppress(AttributeError):
-        setattr(obj, "__config_file__", loader.get_name())
+    try:
+        # This is called for every node, so avoid the overhead of suppress()
+        setattr(obj, "__config_file__", loader.name)
         setattr(obj, "__line__", node.start_mark.line + 1)
+    except AttributeError:
+        pass
     return obj
 
 
@@ -38,7 +38,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.script import (
     SCRIPT_MODE_CHOICES,
     SCRIPT_MODE_PARALLEL,
@@ -1122,6 +1122,61 @@ async def test_reload_automation_when_blueprint_changes(
         assert len(calls) == 3
 
 
+async def test_reload_reuses_validated_config(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test unchanged automations are not validated again at reload."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "alias": "hello",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+
+    async def reload(new_config: dict[str, Any]) -> int:
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=new_config,
+        ), patch(
+            "homeassistant.components.automation.config._try_async_validate_config_item",
+            wraps=automation.config._try_async_validate_config_item,
+        ) as validate_config_item:
+            await hass.services.async_call(
+                automation.DOMAIN, SERVICE_RELOAD, blocking=True
+            )
+        return validate_config_item.call_count
+
+    # Reload the automations without any change
+    assert await reload(config) == 0
+
+    # Reload with an additional automation, only the new automation is validated
+    config[automation.DOMAIN].append(
+        {
+            "alias": "bye",
+            "trigger": {"platform": "event", "event_type": "test_event2"},
+            "action": {"service": "test.automation"},
+        }
+    )
+    assert await reload(config) == 1
+    assert await reload(config) == 0
+
+    # Creating a registry entry does not drop the validated configs
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+    await hass.async_block_till_done()
+    assert await reload(config) == 0
+
+    # A registry update drops the validated configs
+    entity_registry.async_update_entity(entry.entity_id, name="Updated")
+    await hass.async_block_till_done()
+    assert await reload(config) == 2
+    assert await reload(config) == 0
+
+
 async def test_automation_restore_state(hass: HomeAssistant) -> None:
     """Ensure states are restored on startup."""
     time = dt_util.utcnow()
@@ -1854,6 +1909,40 @@ async def test_extraction_functions(
     assert automation.blueprint_in_automation(hass, "automation.test3") is None
 
 
+async def test_extraction_functions_after_reload(hass: HomeAssistant) -> None:
+    """Test extraction functions reflect automations after a reload."""
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                "alias": "hello",
+                "trigger": {"platform": "state", "entity_id": "sensor.old"},
+                "action": {"service": "test.script", "entity_id": "light.old"},
+            }
+        },
+    )
+    assert automation.automations_with_entity(hass, "light.old") == ["automation.hello"]
+    assert automation.automations_with_entity(hass, "light.new") == []
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            DOMAIN: {
+                "alias": "bye",
+                "trigger": {"platform": "state", "entity_id": "sensor.new"},
+                "action": {"service": "test.script", "entity_id": "light.new"},
+            }
+        },
+    ):
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    assert automation.automations_with_entity(hass, "light.old") == []
+    assert automation.automations_with_entity(hass, "light.new") == ["automation.bye"]
+
+
 async def test_logbook_humanify_automation_triggered_event(hass: HomeAssistant) -> None:
     """Test humanifying Automation Trigger event."""
     hass.config.components.add("recorder")
@@ -153,6 +153,7 @@ async def test_diagnostics(
                         "vendor_id": "cc01",
                     },
                 },
+                "callback_match_cache": {"hits": 0, "misses": 0},
                 "advertisement_tracker": {
                     "fallback_intervals": {},
                     "intervals": {},
@@ -280,6 +281,7 @@ async def test_diagnostics_macos(
                         "vendor_id": "Unknown",
                     }
                 },
+                "callback_match_cache": {"hits": 0, "misses": 1},
                 "advertisement_tracker": {
                     "fallback_intervals": {},
                     "intervals": {},
@@ -460,6 +462,7 @@ async def test_diagnostics_remote_adapter(
                         "vendor_id": "cc01",
                     }
                 },
+                "callback_match_cache": {"hits": 0, "misses": 1},
                 "advertisement_tracker": {
                     "fallback_intervals": {},
                     "intervals": {},
@@ -1266,3 +1266,63 @@ async def test_set_fallback_interval_big(
 
     # We should forget fallback interval after it expires
     assert async_get_fallback_availability_interval(hass, "44:44:33:11:23:12") is None
+
+
+async def test_callback_matches_cached_by_advertisement_shape(
+    hass: HomeAssistant,
+    enable_bluetooth: None,
+    register_hci0_scanner: None,
+) -> None:
+    """Test callback matches are cached when only the payload changes."""
+    address = "44:44:33:11:23:45"
+    service_data_uuid = "0000aa01-0000-1000-8000-00805f9b34fb"
+    device = generate_ble_device(address, "sensor")
+    manager = _get_manager()
+    calls: list[BluetoothServiceInfoBleak] = []
+    other_calls: list[BluetoothServiceInfoBleak] = []
+
+    def _inject(value: int) -> None:
+        inject_advertisement_with_source(
+            hass,
+            device,
+            generate_advertisement_data(
+                local_name="sensor", service_data={service_data_uuid: bytes([value])}
+            ),
+            "hci0",
+        )
+
+    cancel = bluetooth.async_register_callback(
+        hass,
+        lambda service_info, change: calls.append(service_info),
+        {"service_data_uuid": service_data_uuid, "connectable": False},
+        BluetoothScanningMode.ACTIVE,
+    )
+    for value in range(3):
+        _inject(value)
+    assert [call.service_data[service_data_uuid] for call in calls] == [
+        b"\x00",
+        b"\x01",
+        b"\x02",
+    ]
+    diagnostics = await manager.async_diagnostics()
+    assert diagnostics["callback_match_cache"] == {"hits": 2, "misses": 1}
+
+    # Registering another callback must not use stale matches
+    cancel_other = bluetooth.async_register_callback(
+        hass,
+        lambda service_info, change: other_calls.append(service_info),
+        {"address": address, "connectable": False},
+        BluetoothScanningMode.ACTIVE,
+    )
+    other_calls.clear()
+    _inject(3)
+    assert len(calls) == 4
+    assert len(other_calls) == 1
+    diagnostics = await manager.async_diagnostics()
+    assert diagnostics["callback_match_cache"] == {"hits": 2, "misses": 2}
+
+    cancel_other()
+    _inject(4)
+    assert len(calls) == 5
+    assert len(other_calls) == 1
+    cancel()
@@ -1,4 +1,5 @@
 """The tests for the camera component."""
+import asyncio
 from http import HTTPStatus
 import io
 from types import ModuleType
@@ -961,6 +962,65 @@ async def test_use_stream_for_stills(
         assert await resp.read() == b"stream_keyframe_image"
 
 
+async def test_camera_proxy_shares_image_requests(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    mock_camera,
+) -> None:
+    """Test concurrent proxy requests share a fetch and snapshots are reused."""
+    client = await hass_client()
+    fetch_started = asyncio.Event()
+    release_fetch = asyncio.Event()
+
+    async def _async_camera_image(width=None, height=None):
+        fetch_started.set()
+        await release_fetch.wait()
+        return b"image"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_async_camera_image,
+    ) as mock_camera_image:
+        first = hass.async_create_task(
+            client.get("/api/camera_proxy/camera.demo_camera")
+        )
+        await fetch_started.wait()
+        second = hass.async_create_task(
+            client.get("/api/camera_proxy/camera.demo_camera")
+        )
+        await asyncio.sleep(0.1)
+        release_fetch.set()
+        for request in (first, second):
+            resp = await request
+            assert resp.status == HTTPStatus.OK
+            assert await resp.read() == b"image"
+        assert mock_camera_image.call_count == 1
+
+        # Snapshots are not reused by default
+        resp = await client.get("/api/camera_proxy/camera.demo_camera")
+        assert resp.status == HTTPStatus.OK
+        assert mock_camera_image.call_count == 2
+
+    demo_camera = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+    demo_camera._attr_snapshot_max_age = 60
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"image",
+    ) as mock_camera_image:
+        for _ in range(2):
+            resp = await client.get("/api/camera_proxy/camera.demo_camera")
+            assert resp.status == HTTPStatus.OK
+            assert await resp.read() == b"image"
+        assert mock_camera_image.call_count == 1
+
+        # Each size is fetched separately
+        resp = await client.get(
+            "/api/camera_proxy/camera.demo_camera?width=10&height=10"
+        )
+        assert resp.status == HTTPStatus.OK
+        assert mock_camera_image.call_count == 2
+
+
 @pytest.mark.parametrize(
     "module",
     [camera, camera.const],
@@ -0,0 +1,50 @@
+"""Test sharing camera image fetches."""
+import asyncio
+from unittest.mock import AsyncMock
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.camera.shared_image import SharedImageRequests
+from homeassistant.core import HomeAssistant
+
+
+async def test_shared_image_requests(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test concurrent requests share a fetch and images expire."""
+    fetched = asyncio.Event()
+
+    async def _fetch() -> bytes:
+        await fetched.wait()
+        return b"image"
+
+    fetch = AsyncMock(side_effect=_fetch)
+    requests: SharedImageRequests[str, bytes] = SharedImageRequests(hass)
+
+    first = hass.async_create_task(requests.async_get("a", 10, fetch, "fetch"))
+    second = hass.async_create_task(requests.async_get("a", 10, fetch, "fetch"))
+    await asyncio.sleep(0)
+    fetched.set()
+    assert await first == b"image"
+    assert await second == b"image"
+    assert fetch.await_count == 1
+
+    # The image is reused within the max age
+    assert await requests.async_get("a", 10, fetch, "fetch") == b"image"
+    assert fetch.await_count == 1
+
+    # Expired images are dropped when a new image is stored
+    freezer.tick(10)
+    assert await requests.async_get("b", 10, fetch, "fetch") == b"image"
+    assert "a" not in requests._images
+    assert fetch.await_count == 2
+
+    # Removed images are fetched again
+    requests.async_remove("b")
+    assert await requests.async_get("b", 10, fetch, "fetch") == b"image"
+    assert fetch.await_count == 3
+
+    # Images are not kept without a max age
+    assert await requests.async_get("c", 0, fetch, "fetch") == b"image"
+    assert await requests.async_get("c", 0, fetch, "fetch") == b"image"
+    assert fetch.await_count == 5
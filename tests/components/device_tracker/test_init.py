@@ -1,4 +1,5 @@
 """The tests for the device tracker component."""
+import asyncio
 from datetime import datetime, timedelta
 import json
 import logging
@@ -129,6 +130,36 @@ async def test_reading_yaml_config(
     assert f"test.{device_tracker.DOMAIN}" in hass.config.components
 
 
+async def test_update_config_writes_queued_devices_together(
+    hass: HomeAssistant, yaml_devices
+) -> None:
+    """Test devices added while the config is written are written together."""
+    written: list[list[str]] = []
+
+    # Not a mock, mocked executor jobs are run in the event loop in tests
+    def _update_config_devices(path: str, devices: list[legacy.Device]) -> None:
+        written.append([device.dev_id for device in devices])
+        update_config_devices(path, devices)
+
+    update_config_devices = legacy.update_config_devices
+    tracker = legacy.DeviceTracker(hass, timedelta(seconds=180), True, {}, [])
+    devices = [
+        legacy.Device(hass, timedelta(seconds=180), True, dev_id, None, dev_id)
+        for dev_id in ("first", "second", "third")
+    ]
+    with patch.object(legacy, "update_config_devices", _update_config_devices):
+        await asyncio.gather(
+            *(
+                tracker.async_update_config(yaml_devices, dev.dev_id, dev)
+                for dev in devices
+            )
+        )
+
+    assert written == [["first"], ["second", "third"]]
+    config = await legacy.async_load_config(yaml_devices, hass, timedelta(seconds=180))
+    assert [device.dev_id for device in config] == ["first", "second", "third"]
+
+
 @patch("homeassistant.components.device_tracker.const.LOGGER.warning")
 async def test_duplicate_mac_dev_id(mock_warning, hass: HomeAssistant) -> None:
     """Test adding duplicate MACs or device IDs to DeviceTracker."""
@@ -474,6 +505,39 @@ async def test_see_state(
     assert attrs["number"] == 1
 
 
+async def test_see_only_writes_changed_state(
+    hass: HomeAssistant,
+    mock_device_tracker_conf: list[legacy.Device],
+    enable_custom_integrations: None,
+) -> None:
+    """Test seeing an unchanged device does not write its state again."""
+    assert await async_setup_component(hass, device_tracker.DOMAIN, TEST_PLATFORM)
+    params = {
+        "dev_id": "some_device",
+        "host_name": "example.com",
+        "location_name": "Work",
+        "attributes": {"test": "test"},
+    }
+    common.async_see(hass, **params)
+    await hass.async_block_till_done()
+    assert len(mock_device_tracker_conf) == 1
+
+    with patch.object(legacy.Device, "async_write_ha_state") as mock_write:
+        common.async_see(hass, **params)
+        await hass.async_block_till_done()
+        assert len(mock_write.mock_calls) == 0
+
+        common.async_see(hass, **{**params, "attributes": {"test": "changed"}})
+        await hass.async_block_till_done()
+        assert len(mock_write.mock_calls) == 1
+
+        common.async_see(hass, **{**params, "location_name": "Home"})
+        await hass.async_block_till_done()
+        assert len(mock_write.mock_calls) == 2
+
+    assert len(mock_device_tracker_conf) == 1
+
+
 async def test_see_passive_zone_state(
     hass: HomeAssistant,
     mock_device_tracker_conf: list[legacy.Device],
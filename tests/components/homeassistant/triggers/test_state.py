@@ -696,6 +696,43 @@ async def test_if_not_fires_on_entities_change_with_for_after_stop(
     assert len(calls) == 1
 
 
+async def test_if_not_fires_on_all_change_with_for_after_stop(
+    hass: HomeAssistant, calls
+) -> None:
+    """Test all pending timers of an entity are cancelled when stopping."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": "test.entity",
+                    "for": {"seconds": 5},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    # The attribute change starts a second timer while the first one is pending
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    hass.states.async_set("test.entity", "world", {"some": "attribute"})
+    await hass.async_block_till_done()
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+
 async def test_if_fires_on_entity_change_with_for_attribute_change(
     hass: HomeAssistant, freezer: FrozenDateTimeFactory, calls
 ) -> None:
@@ -1,13 +1,16 @@
 """The tests for the image_processing component."""
 from unittest.mock import PropertyMock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
+from homeassistant.components.camera import Image
 import homeassistant.components.http as http
 import homeassistant.components.image_processing as ip
 from homeassistant.const import ATTR_ENTITY_PICTURE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.setup import async_setup_component
 
 from . import common
@@ -101,6 +104,55 @@ async def test_get_image_from_camera(
     assert state.attributes["image"] == b"Test"
 
 
+async def test_image_shared_between_entities(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    enable_custom_integrations: None,
+) -> None:
+    """Test entities processing the same camera share the fetched image."""
+    config = {
+        ip.DOMAIN: [{"platform": "test"}, {"platform": "demo"}],
+        "camera": {"platform": "demo"},
+    }
+    await async_setup_component(hass, ip.DOMAIN, config)
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.camera.async_get_image",
+        return_value=Image("image/jpeg", b"Test"),
+    ) as mock_image, patch(
+        "homeassistant.components.demo.image_processing."
+        "DemoImageProcessingFace.process_image"
+    ) as mock_process_face:
+        common.async_scan(hass)
+        await hass.async_block_till_done()
+        assert mock_image.call_count == 1
+        assert hass.states.get("image_processing.test").attributes["image"] == b"Test"
+        mock_process_face.assert_called_once_with(b"Test")
+
+        # The image is reused within the max age
+        common.async_scan(hass, entity_id="image_processing.test")
+        await hass.async_block_till_done()
+        assert mock_image.call_count == 1
+
+        # The image is dropped when an entity processing the camera is removed
+        platform = next(
+            platform
+            for platform in async_get_platforms(hass, "demo")
+            if platform.domain == ip.DOMAIN
+        )
+        await platform.async_remove_entity("image_processing.demo_face")
+        common.async_scan(hass, entity_id="image_processing.test")
+        await hass.async_block_till_done()
+        assert mock_image.call_count == 2
+
+        # A new image is fetched once the shared image is too old
+        freezer.tick(ip.SHARED_IMAGE_MAX_AGE)
+        common.async_scan(hass, entity_id="image_processing.test")
+        await hass.async_block_till_done()
+        assert mock_image.call_count == 3
+
+
 @patch(
     "homeassistant.components.camera.async_get_image",
     side_effect=HomeAssistantError(),
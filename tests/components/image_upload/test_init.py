@@ -1,11 +1,18 @@
 """Test that we can upload images."""
+import asyncio
+import io
 import pathlib
 import tempfile
+import threading
+import time
+from typing import Any
 from unittest.mock import patch
 
-from aiohttp import ClientSession, ClientWebSocketResponse
+from aiohttp import ClientSession, ClientWebSocketResponse, FormData
 from freezegun.api import FrozenDateTimeFactory
+from PIL import Image
 
+from homeassistant.components import image_upload
 from homeassistant.components.websocket_api import const as ws_const
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -84,3 +91,96 @@ async def test_upload_image(
 
         # Ensure removed from disk
         assert not item_folder.is_dir()
+
+
+async def test_serve_sizes_concurrently(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test concurrent requests share the generated thumbnails."""
+    jpeg = io.BytesIO()
+    Image.new("RGB", (2048, 1024), "blue").save(jpeg, format="jpeg")
+    jpeg.seek(0)
+
+    with tempfile.TemporaryDirectory() as tempdir, patch.object(
+        hass.config, "path", return_value=tempdir
+    ):
+        assert await async_setup_component(hass, "image_upload", {})
+        client: ClientSession = await hass_client()
+
+        data = FormData()
+        data.add_field("file", jpeg, filename="image.jpg", content_type="image/jpeg")
+        res = await client.post("/api/image/upload", data=data)
+        assert res.status == 200
+        item = await res.json()
+        assert item["content_type"] == "image/jpeg"
+
+        with patch(
+            "homeassistant.components.image_upload._generate_thumbnail",
+            wraps=image_upload._generate_thumbnail,
+        ) as generate_thumbnail:
+            responses = await asyncio.gather(
+                *(
+                    client.get(f"/api/image/serve/{item['id']}/{size}x{size}")
+                    for size in (256, 512, 256, 512)
+                )
+            )
+            assert [res.status for res in responses] == [200] * 4
+            assert [
+                Image.open(io.BytesIO(await res.read())).size for res in responses
+            ] == [(256, 128), (512, 256), (256, 128), (512, 256)]
+            assert generate_thumbnail.call_count == 2
+
+
+async def test_serve_limits_concurrent_transforms(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the number of thumbnails generated at once is limited."""
+    jpeg = io.BytesIO()
+    Image.new("RGB", (2048, 1024), "blue").save(jpeg, format="jpeg")
+    jpeg.seek(0)
+
+    calls = 0
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+    generate_thumbnail = image_upload._generate_thumbnail
+
+    # Not a mock, mocked executor jobs are run in the event loop in tests
+    def _generate_thumbnail(*args: Any) -> None:
+        nonlocal calls, running, max_running
+        with lock:
+            calls += 1
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        generate_thumbnail(*args)
+        with lock:
+            running -= 1
+
+    with tempfile.TemporaryDirectory() as tempdir, patch.object(
+        hass.config, "path", return_value=tempdir
+    ), patch.object(image_upload, "MAX_CONCURRENT_TRANSFORMS", 1):
+        assert await async_setup_component(hass, "image_upload", {})
+        client: ClientSession = await hass_client()
+
+        data = FormData()
+        data.add_field("file", jpeg, filename="image.jpg", content_type="image/jpeg")
+        res = await client.post("/api/image/upload", data=data)
+        assert res.status == 200
+        item = await res.json()
+
+        with patch(
+            "homeassistant.components.image_upload._generate_thumbnail",
+            _generate_thumbnail,
+        ):
+            responses = await asyncio.gather(
+                *(
+                    client.get(f"/api/image/serve/{item['id']}/{size}x{size}")
+                    for size in (256, 512)
+                )
+            )
+            assert [res.status for res in responses] == [200] * 2
+            assert calls == 2
+            assert max_running == 1
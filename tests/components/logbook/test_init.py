@@ -9,6 +9,7 @@ from unittest.mock import Mock
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy.engine.row import Row
 import voluptuous as vol
 
 from homeassistant.components import logbook, recorder
@@ -17,7 +18,12 @@ from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook.models import LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
+from homeassistant.components.logbook.queries.context import context_ids_stmt
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.util import (
+    execute_stmt_lambda_element,
+    session_scope,
+)
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import (
@@ -46,6 +52,7 @@ from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import ulid_to_bytes
 
 from .common import MockRow, mock_humanify
 
@@ -1391,6 +1398,121 @@ async def test_logbook_entity_context_parent_id(
     assert json_dict[8]["context_user_id"] == "485cacf93ef84d25a99ced3126b921d2"
 
 
+async def test_logbook_context_parent_outside_of_period(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the parent context is resolved when it is outside of the period."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+
+    await async_recorder_block_till_done(hass)
+
+    context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=context,
+    )
+    await async_wait_recording_done(hass)
+
+    child_start = dt_util.utcnow()
+    child_context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVDDD",
+        parent_id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(
+        EVENT_SCRIPT_STARTED,
+        {ATTR_NAME: "Mock script", ATTR_ENTITY_ID: "script.mock_script"},
+        context=child_context,
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    end_time = child_start + timedelta(hours=1)
+
+    # The parent context is not part of the period
+    response = await client.get(
+        f"/api/logbook/{child_start.isoformat()}",
+        params={"end_time": end_time.isoformat()},
+    )
+    assert response.status == HTTPStatus.OK
+    json_dict = await response.json()
+    assert len(json_dict) == 1
+    assert json_dict[0]["entity_id"] == "script.mock_script"
+    assert json_dict[0]["context_event_type"] == "automation_triggered"
+    assert json_dict[0]["context_entity_id"] == "automation.alarm"
+    assert json_dict[0]["context_name"] == "Mock automation"
+
+
+async def test_logbook_context_outside_of_period(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test a context that started before the period is resolved to its origin."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+
+    await async_recorder_block_till_done(hass)
+
+    context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=context,
+    )
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    end_time = start + timedelta(hours=1)
+
+    # The automation that started the context is not part of the period
+    response = await client.get(
+        f"/api/logbook/{start.isoformat()}",
+        params={"end_time": end_time.isoformat()},
+    )
+    assert response.status == HTTPStatus.OK
+    json_dict = await response.json()
+    assert len(json_dict) == 1
+    assert json_dict[0]["entity_id"] == "light.kitchen"
+    assert json_dict[0]["state"] == STATE_OFF
+    assert json_dict[0]["context_event_type"] == "automation_triggered"
+    assert json_dict[0]["context_entity_id"] == "automation.alarm"
+    assert json_dict[0]["context_name"] == "Mock automation"
+
+    # Only the origin row of the context is looked up
+    def _context_rows() -> list[Row]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return execute_stmt_lambda_element(
+                session,
+                context_ids_stmt(end_time.timestamp(), [ulid_to_bytes(context.id)]),
+                orm_rows=False,
+            )
+
+    rows = await recorder_mock.async_add_executor_job(_context_rows)
+    assert len(rows) == 1
+    assert rows[0].event_type == EVENT_AUTOMATION_TRIGGERED
+    assert rows[0].context_only
+
+
 async def test_logbook_context_from_template(
     recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
@@ -21,6 +21,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import COARSE_TIMER_RESOLUTION
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
@@ -402,8 +403,18 @@ async def expires_helper(hass: HomeAssistant) -> None:
         state = hass.states.get("sensor.test")
         assert state.state == "101"
 
-        # Time jump +2s
-        now += timedelta(seconds=2)
+        # Time jump +0.9s, just before expire_after
+        now += timedelta(seconds=0.9)
+        freezer.move_to(now)
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+        # Value is not yet expired
+        state = hass.states.get("sensor.test")
+        assert state.state == "101"
+
+        # Time jump to expire_after plus the worst case delay of the coarse timer
+        now += timedelta(seconds=0.1 + COARSE_TIMER_RESOLUTION)
         freezer.move_to(now)
         async_fire_time_changed(hass, now)
         await hass.async_block_till_done()
@@ -27,6 +27,7 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later_coarse
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -225,12 +226,14 @@ async def test_log_scheduled(
     assert hass.services.has_service(DOMAIN, SERVICE_LOG_EVENT_LOOP_SCHEDULED)
 
     hass.loop.call_later(0.1, lambda: None)
+    async_call_later_coarse(hass, 10, lambda _: None, name="coarse job")
 
     await hass.services.async_call(
         DOMAIN, SERVICE_LOG_EVENT_LOOP_SCHEDULED, {}, blocking=True
     )
 
     assert "Scheduled" in caplog.text
+    assert "Scheduled coarse: coarse job (1 timers)" in caplog.text
     caplog.clear()
 
     assert await hass.config_entries.async_unload(entry.entry_id)
@@ -7,21 +7,24 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import sqlite3
 import threading
-from typing import cast
+from typing import Any, cast
 from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
+import voluptuous as vol
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
     CONF_COMMIT_INTERVAL,
+    CONF_COMPACT_KEEP_DAYS,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
+    CONF_PURGE_KEEP_DAYS,
     CONFIG_SCHEMA,
     DOMAIN,
     SQLITE_URL_PREFIX,
@@ -1064,6 +1067,64 @@ def test_auto_purge_auto_repack_on_second_sunday(
     dt_util.set_default_time_zone(original_tz)
 
 
+@pytest.mark.parametrize("enable_nightly_purge", [True])
+def test_auto_purge_compacts_old_states(
+    hass_recorder: Callable[..., HomeAssistant], hass_storage: dict[str, Any]
+) -> None:
+    """Test periodic purge scheduling compacts states when configured."""
+    hass = hass_recorder({CONF_COMPACT_KEEP_DAYS: 3})
+
+    original_tz = dt_util.DEFAULT_TIME_ZONE
+
+    tz = dt_util.get_time_zone("Europe/Copenhagen")
+    dt_util.set_default_time_zone(tz)
+
+    now = dt_util.utcnow()
+    test_time = datetime(now.year + 2, 1, 1, 4, 15, 0, tzinfo=tz)
+    run_tasks_at_time(hass, test_time)
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_old_data, patch(
+        "homeassistant.components.recorder.purge.compact_old_states",
+        return_value=True,
+    ) as compact_old_states, patch(
+        "homeassistant.components.recorder.tasks.periodic_db_cleanups"
+    ):
+        # Advance one day, and the purge and compact tasks should run
+        test_time = test_time + timedelta(days=1)
+        run_tasks_at_time(hass, test_time)
+        assert len(purge_old_data.mock_calls) == 1
+        assert len(compact_old_states.mock_calls) == 1
+        purge_args, _ = purge_old_data.call_args_list[0]
+        compact_args, _ = compact_old_states.call_args_list[0]
+        # The default purge_keep_days is 10
+        assert compact_args[1] - purge_args[1] >= timedelta(days=7)
+        assert compact_args[1] - purge_args[1] < timedelta(days=7, minutes=1)
+
+        # Advance one day, only states since the previous compaction are compacted
+        test_time = test_time + timedelta(days=1)
+        run_tasks_at_time(hass, test_time)
+        assert len(compact_old_states.mock_calls) == 2
+        next_compact_args, _ = compact_old_states.call_args_list[1]
+        assert next_compact_args[2] == compact_args[1]
+        hass.block_till_done()
+        assert hass_storage["recorder.compact_states"]["data"] == {
+            "compacted_before": next_compact_args[1].timestamp()
+        }
+
+    dt_util.set_default_time_zone(original_tz)
+
+
+def test_compact_keep_days_must_be_less_than_purge_keep_days() -> None:
+    """Test states must be compacted before they are purged."""
+    assert CONFIG_SCHEMA({DOMAIN: {CONF_COMPACT_KEEP_DAYS: 3}})
+    with pytest.raises(vol.Invalid):
+        CONFIG_SCHEMA({DOMAIN: {CONF_COMPACT_KEEP_DAYS: 10}})
+    with pytest.raises(vol.Invalid):
+        CONFIG_SCHEMA({DOMAIN: {CONF_COMPACT_KEEP_DAYS: 5, CONF_PURGE_KEEP_DAYS: 4}})
+
+
 @pytest.mark.parametrize("enable_nightly_purge", [True])
 def test_auto_purge_auto_repack_disabled_on_second_sunday(
     hass_recorder: Callable[..., HomeAssistant],
@@ -18,11 +18,16 @@ from homeassistant.components.recorder.db_schema import (
     StateAttributes,
     States,
     StatesMeta,
+    StatisticsMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    compact_old_states,
+    find_compacted_before,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -100,6 +105,40 @@ async def test_purge_big_database(
         assert state_attributes.count() == 1
 
 
+async def test_purge_big_database_exceeding_time_slice(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge cycle stops early when the time slice is exceeded."""
+
+    instance = await async_setup_recorder_instance(hass)
+
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    with patch.object(instance, "max_bind_vars", 24), patch.object(
+        instance.database_engine, "max_bind_vars", 24
+    ), patch(
+        "homeassistant.components.recorder.purge.PURGE_TABLE_TIME_SLICE", -1
+    ), session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 72
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 48
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 24
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert states.count() == 24
+
+
 async def test_purge_old_states(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
@@ -188,6 +227,202 @@ async def test_purge_old_states(
         assert state_attributes.count() == 3
 
 
+@pytest.mark.parametrize("dialect", [SupportedDialect.SQLITE, SupportedDialect.MYSQL])
+async def test_purge_old_states_disconnects_kept_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    dialect: SupportedDialect,
+) -> None:
+    """Test only states that are kept are disconnected unless using MySQL."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with patch.object(instance.database_engine, "dialect", dialect), patch(
+        "homeassistant.components.recorder.purge.disconnect_states_rows",
+        wraps=recorder.purge.disconnect_states_rows,
+    ) as disconnect_states_rows, patch(
+        "homeassistant.components.recorder.purge.update_states_old_state_id",
+        wraps=recorder.purge.update_states_old_state_id,
+    ) as update_states_old_state_id:
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+
+    if dialect == SupportedDialect.SQLITE:
+        assert disconnect_states_rows.call_count == 0
+        # Only dontpurgeme_4 links to a purged state
+        assert update_states_old_state_id.call_count == 1
+        assert len(update_states_old_state_id.call_args[0][0]) == 1
+    else:
+        assert disconnect_states_rows.call_count == 1
+        assert update_states_old_state_id.call_count == 0
+
+    with session_scope(hass=hass) as session:
+        state_map_by_state = {state.state: state for state in session.query(States)}
+        assert len(state_map_by_state) == 2
+        assert state_map_by_state["dontpurgeme_4"].old_state_id is None
+        assert (
+            state_map_by_state["dontpurgeme_5"].old_state_id
+            == state_map_by_state["dontpurgeme_4"].state_id
+        )
+
+
+async def test_compact_old_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test compacting old states to state changes only."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    utcnow = dt_util.utcnow()
+    five_days_ago = utcnow - timedelta(days=5)
+
+    with freeze_time(five_days_ago) as freezer:
+        for state, attributes in (
+            ("on", {"attr": 1}),
+            ("on", {"attr": 2}),
+            ("on", {"attr": 3}),
+            ("off", {"attr": 3}),
+            ("on", {"attr": 4}),
+        ):
+            hass.states.async_set("test.compact", state, attributes)
+            hass.states.async_set("test.latest", state, attributes)
+            hass.states.async_set("test.statistics", state, attributes)
+            await async_wait_recording_done(hass)
+            freezer.tick(timedelta(minutes=1))
+        hass.states.async_set("test.latest", "on", {"attr": 5})
+        await async_wait_recording_done(hass)
+        freezer.move_to(utcnow)
+        hass.states.async_set("test.compact", "on", {"attr": 5})
+        hass.states.async_set("test.statistics", "on", {"attr": 5})
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        session.add(
+            StatisticsMeta(
+                statistic_id="test.statistics",
+                source="recorder",
+                unit_of_measurement=None,
+                has_mean=True,
+                has_sum=False,
+                name=None,
+            )
+        )
+
+    def _get_states(entity_id: str) -> list[tuple[int, int | None, str]]:
+        with session_scope(hass=hass) as session:
+            return [
+                (state.state_id, state.old_state_id, state.state)
+                for state in session.query(States)
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == entity_id)
+                .order_by(States.state_id)
+            ]
+
+    compact_states = _get_states("test.compact")
+    assert len(compact_states) == 6
+    latest_states = _get_states("test.latest")
+    assert len(latest_states) == 6
+    statistics_states = _get_states("test.statistics")
+    assert len(statistics_states) == 6
+
+    # States before the previous compaction are not compacted again
+    finished = await instance.async_add_executor_job(
+        compact_old_states,
+        instance,
+        utcnow - timedelta(days=1),
+        utcnow - timedelta(days=2),
+    )
+    assert finished
+    assert _get_states("test.compact") == compact_states
+
+    finished = await instance.async_add_executor_job(
+        compact_old_states,
+        instance,
+        utcnow - timedelta(days=1),
+        utcnow - timedelta(days=6),
+    )
+    assert finished
+
+    # The attribute only changes are removed and the state that
+    # followed them is linked to the state before them
+    first, _, _, off, on, newest = compact_states
+    assert _get_states("test.compact") == [
+        first,
+        (off[0], first[0], "off"),
+        on,
+        newest,
+    ]
+    # The latest state of an entity is never compacted
+    first, _, _, off, on, latest = latest_states
+    assert _get_states("test.latest") == [
+        first,
+        (off[0], first[0], "off"),
+        on,
+        latest,
+    ]
+    # Entities with statistics are not compacted
+    assert _get_states("test.statistics") == statistics_states
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 5
+
+
+async def test_compact_old_states_newest_state_in_next_run(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the newest state of an entity is compacted once a newer state follows."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    start = dt_util.utcnow() - timedelta(days=5)
+
+    def _get_states() -> list[tuple[int, int | None, int | None]]:
+        with session_scope(hass=hass) as session:
+            return [
+                (state.state_id, state.old_state_id, state.attributes_id)
+                for state in session.query(States)
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "test.compact")
+                .order_by(States.state_id)
+            ]
+
+    with freeze_time(start) as freezer:
+        hass.states.async_set("test.compact", "on", {"attr": 1})
+        await async_wait_recording_done(hass)
+        freezer.tick(timedelta(minutes=1))
+        hass.states.async_set("test.compact", "on", {"attr": 2})
+        await async_wait_recording_done(hass)
+
+    # The newest state can not be compacted yet and holds back the watermark
+    compact_before = start + timedelta(minutes=10)
+    assert await instance.async_add_executor_job(
+        compact_old_states, instance, compact_before
+    )
+    compacted_before = await instance.async_add_executor_job(
+        find_compacted_before, instance, compact_before
+    )
+    assert compacted_before == start + timedelta(minutes=1)
+    first, pending = _get_states()
+
+    with freeze_time(start + timedelta(minutes=20)):
+        hass.states.async_set("test.compact", "on", {"attr": 3})
+        await async_wait_recording_done(hass)
+
+    # The next run compacts it now that a newer state follows it
+    compact_before = start + timedelta(minutes=30)
+    assert await instance.async_add_executor_job(
+        compact_old_states, instance, compact_before, compacted_before
+    )
+    newest = _get_states()[-1]
+    assert _get_states() == [first, (newest[0], first[0], newest[2])]
+    assert pending not in _get_states()
+    assert await instance.async_add_executor_job(
+        find_compacted_before, instance, compact_before, compacted_before
+    ) == start + timedelta(minutes=20)
+
+
 async def test_purge_old_states_encouters_database_corruption(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
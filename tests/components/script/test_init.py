@@ -498,6 +498,49 @@ async def test_reload_unchanged_script(
         assert len(calls) == 2
 
 
+async def test_reload_reuses_validated_config(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test unchanged scripts are not validated again at reload."""
+    config = {
+        script.DOMAIN: {
+            "test": {"sequence": [{"service": "test.script"}]},
+        }
+    }
+    assert await async_setup_component(hass, script.DOMAIN, config)
+
+    async def reload(new_config: dict[str, Any]) -> int:
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=new_config,
+        ), patch(
+            "homeassistant.components.script.config._try_async_validate_config_item",
+            wraps=script.config._try_async_validate_config_item,
+        ) as validate_config_item:
+            await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+        return validate_config_item.call_count
+
+    # Reload the scripts without any change
+    assert await reload(config) == 0
+
+    # Reload with an additional script, only the new script is validated
+    config[script.DOMAIN]["test2"] = {"sequence": [{"service": "test.script"}]}
+    assert await reload(config) == 1
+    assert await reload(config) == 0
+
+    # Creating a registry entry does not drop the validated configs
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+    await hass.async_block_till_done()
+    assert await reload(config) == 0
+
+    # A registry update drops the validated configs
+    entity_registry.async_update_entity(entry.entity_id, name="Updated")
+    await hass.async_block_till_done()
+    assert await reload(config) == 2
+    assert await reload(config) == 0
+
+
 async def test_service_descriptions(hass: HomeAssistant) -> None:
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
@@ -837,6 +880,124 @@ async def test_extraction_functions(
     assert script.blueprint_in_script(hass, "script.test3") is None
 
 
+async def test_extraction_functions_after_reload(hass: HomeAssistant) -> None:
+    """Test the index of referenced ids is rebuilt when scripts change."""
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                "test1": {
+                    "sequence": [
+                        {"service": "test.script", "entity_id": "light.old"},
+                        {"service": "test.test", "target": {"area_id": "area-old"}},
+                    ]
+                },
+                "test2": {
+                    "sequence": [{"service": "test.script", "entity_id": "light.old"}]
+                },
+            }
+        },
+    )
+    assert script.DATA_REFERENCES not in hass.data
+    assert set(script.scripts_with_entity(hass, "light.old")) == {
+        "script.test1",
+        "script.test2",
+    }
+    assert script.scripts_with_area(hass, "area-old") == ["script.test1"]
+    assert script.scripts_with_device(hass, "device-old") == []
+    assert script.scripts_with_blueprint(hass, "blabla.yaml") == []
+    # The index is built once and reused
+    references = hass.data[script.DATA_REFERENCES]
+    assert script.scripts_with_entity(hass, "light.new") == []
+    assert hass.data[script.DATA_REFERENCES] is references
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            DOMAIN: {
+                "test1": {
+                    "sequence": [
+                        {"service": "test.script", "entity_id": "light.old"},
+                        {"service": "test.test", "target": {"area_id": "area-old"}},
+                    ]
+                },
+                "test3": {
+                    "sequence": [
+                        {"service": "test.script", "entity_id": "light.new"},
+                        {"service": "test.test", "target": {"area_id": "area-new"}},
+                    ]
+                },
+            }
+        },
+    ):
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    # Adding and removing scripts drops the index
+    assert script.DATA_REFERENCES not in hass.data
+    assert script.scripts_with_entity(hass, "light.old") == ["script.test1"]
+    assert script.scripts_with_entity(hass, "light.new") == ["script.test3"]
+    assert script.scripts_with_area(hass, "area-old") == ["script.test1"]
+    assert script.scripts_with_area(hass, "area-new") == ["script.test3"]
+
+    # Removing a script drops the index
+    await hass.data[DOMAIN].get_entity("script.test3").async_remove()
+    assert script.DATA_REFERENCES not in hass.data
+    assert script.scripts_with_entity(hass, "light.new") == []
+
+
+async def test_reload_matches_scripts_by_key(hass: HomeAssistant) -> None:
+    """Test reloading keeps unchanged scripts and recreates changed ones."""
+    event_sequence = {"sequence": [{"event": "test_event"}]}
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                "keep": event_sequence,
+                "change": event_sequence,
+                "remove": event_sequence,
+                "old_name": event_sequence,
+            }
+        },
+    )
+    component = hass.data[DOMAIN]
+    keep = component.get_entity("script.keep")
+    change = component.get_entity("script.change")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            DOMAIN: {
+                "keep": event_sequence,
+                "change": {"sequence": [{"event": "changed_event"}]},
+                "new_name": event_sequence,
+                "add": event_sequence,
+            }
+        },
+    ):
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    assert {entity.entity_id for entity in component.entities} == {
+        "script.keep",
+        "script.change",
+        "script.new_name",
+        "script.add",
+    }
+    assert component.get_entity("script.remove") is None
+    assert component.get_entity("script.old_name") is None
+    # Unchanged scripts are kept, changed scripts are recreated
+    assert component.get_entity("script.keep") is keep
+    assert component.get_entity("script.change") is not change
+    assert component.get_entity("script.change").raw_config == {
+        "sequence": [{"event": "changed_event"}]
+    }
+
+
 async def test_config_basic(hass: HomeAssistant) -> None:
     """Test passing info in config."""
     assert await async_setup_component(
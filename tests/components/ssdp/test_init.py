@@ -462,6 +462,44 @@ async def test_start_stop_scanner(mock_source_set, hass: HomeAssistant) -> None:
     assert ssdp_listener.async_stop.call_count == 1
 
 
+@pytest.mark.usefixtures("mock_get_source_ip")
+@patch("homeassistant.components.ssdp.async_get_ssdp", return_value={})
+async def test_unusable_description_is_not_looked_up_again(
+    mock_get_ssdp,
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test devices without a usable description are processed from the cache."""
+    aioclient_mock.get("http://1.1.1.1", text="not a description")
+    mock_ssdp_search_response = _ssdp_headers(
+        {
+            "st": "mock-st",
+            "location": "http://1.1.1.1",
+            "usn": "uuid:mock-udn::mock-st",
+            "_source": "search",
+        }
+    )
+    ssdp_listener = await init_ssdp_component(hass)
+    async_integration_callback = AsyncMock()
+    await ssdp.async_register_callback(
+        hass, async_integration_callback, {"st": "mock-st"}
+    )
+
+    ssdp_listener._on_search(mock_ssdp_search_response)
+    await hass.async_block_till_done()
+    assert async_integration_callback.call_count == 1
+    assert aioclient_mock.call_count == 1
+
+    with patch.object(
+        ssdp.Scanner, "_ssdp_listener_process_callback_with_lookup"
+    ) as mock_lookup:
+        ssdp_listener._on_search(mock_ssdp_search_response)
+        await hass.async_block_till_done()
+    assert not mock_lookup.called
+    assert async_integration_callback.call_count == 2
+    assert aioclient_mock.call_count == 1
+
+
 @pytest.mark.usefixtures("mock_get_source_ip")
 @patch("homeassistant.components.ssdp.async_get_ssdp", return_value={})
 async def test_scan_with_registered_callback(
@@ -871,3 +909,35 @@ async def test_flow_dismiss_on_byebye(
 
     assert len(mock_async_progress_by_init_data_type.mock_calls) == 1
     assert mock_async_abort.mock_calls[0][1][0] == "mock_flow_id"
+
+
+def test_integration_matchers() -> None:
+    """Test matching is case insensitive and requires every key to match."""
+    matchers = ssdp.IntegrationMatchers()
+    matchers.async_setup(
+        {
+            "mock-domain": [
+                {
+                    ssdp.ATTR_UPNP_MANUFACTURER: "Paulus",
+                    ssdp.ATTR_UPNP_DEVICE_TYPE: "Paulus",
+                }
+            ],
+            "other-domain": [{ssdp.ATTR_ST: "mock-st"}],
+        }
+    )
+
+    assert matchers.async_matching_domains(
+        CaseInsensitiveDict(
+            {"ST": "mock-st", "MANUFACTURER": "Paulus", "DEVICETYPE": "Paulus"}
+        )
+    ) == {"mock-domain", "other-domain"}
+    assert (
+        matchers.async_matching_domains(
+            CaseInsensitiveDict({"manufacturer": "Paulus", "deviceType": "Other"})
+        )
+        == set()
+    )
+    assert (
+        matchers.async_matching_domains(CaseInsensitiveDict({"deviceType": "Paulus"}))
+        == set()
+    )
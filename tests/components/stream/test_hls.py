@@ -2,7 +2,7 @@
 from datetime import timedelta
 from http import HTTPStatus
 import logging
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 from urllib.parse import urlparse
 
 import av
@@ -187,6 +187,7 @@ async def test_hls_stream(
     assert stream.get_diagnostics() == {
         "container_format": "mov,mp4,m4a,3gp,3g2,mj2",
         "keepalive": False,
+        "open_time": ANY,
         "orientation": Orientation.NO_TRANSFORM,
         "start_worker": 1,
         "video_codec": "h264",
@@ -377,6 +378,25 @@ async def test_hls_playlist_view(
     await stream.stop()
 
 
+async def test_segment_data_joined_once(hass: HomeAssistant) -> None:
+    """Test the data of a complete segment is joined once and then shared."""
+    segment = Segment(sequence=0)
+    segment.async_add_part(Part(duration=1, has_keyframe=True, data=b"part0"), 0)
+    segment.async_add_part(Part(duration=1, has_keyframe=False, data=b"part1"), 0)
+    # Incomplete segments are joined again when more parts are added
+    assert segment.get_data() == b"part0part1"
+    segment.async_add_part(Part(duration=1, has_keyframe=False, data=b"part2"), 3)
+    data = segment.get_data()
+    assert data == b"part0part1part2"
+    assert segment.get_data() is data
+    # The part data is released and replaced by views of the joined data
+    for part, part_data in zip(segment.parts, (b"part0", b"part1", b"part2")):
+        assert isinstance(part.data, memoryview)
+        assert part.data.obj is data
+        assert part.data == part_data
+    assert segment.data_size == len(data)
+
+
 async def test_hls_max_segments(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
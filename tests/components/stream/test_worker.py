@@ -14,12 +14,13 @@ failure modes or corner cases like how out of order packets are handled.
 """
 import asyncio
 import fractions
+from functools import partial
 import io
 import logging
 import math
 from pathlib import Path
 import threading
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import av
 import numpy as np
@@ -28,15 +29,19 @@ import pytest
 from homeassistant.components.stream import KeyFrameConverter, Stream, create_stream
 from homeassistant.components.stream.const import (
     ATTR_SETTINGS,
+    ATTR_SOURCE_OPEN_SEMAPHORE,
     CONF_LL_HLS,
     CONF_PART_DURATION,
     CONF_SEGMENT_DURATION,
     DOMAIN,
     HLS_PROVIDER,
+    MAX_CONCURRENT_SOURCE_OPENS,
     MAX_MISSING_DTS,
     PACKETS_TO_WAIT_FOR_AUDIO,
     RECORDER_PROVIDER,
     SEGMENT_DURATION_ADJUSTER,
+    SOURCE_OPEN_TIMEOUT,
+    SOURCE_TIMEOUT,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 from homeassistant.components.stream.core import Orientation, StreamSettings
@@ -92,7 +97,10 @@ def mock_stream_settings(hass):
             part_target_duration=TARGET_SEGMENT_DURATION_NON_LL_HLS,
             hls_advance_part_limit=3,
             hls_part_timeout=TARGET_SEGMENT_DURATION_NON_LL_HLS,
-        )
+        ),
+        ATTR_SOURCE_OPEN_SEMAPHORE: threading.BoundedSemaphore(
+            MAX_CONCURRENT_SOURCE_OPENS
+        ),
     }
 
 
@@ -292,6 +300,7 @@ def run_worker(hass, stream, stream_source, stream_settings=None):
         stream_state,
         KeyFrameConverter(hass, stream_settings, dynamic_stream_settings()),
         threading.Event(),
+        hass.data[DOMAIN][ATTR_SOURCE_OPEN_SEMAPHORE],
     )
 
 
@@ -344,6 +353,49 @@ async def test_stream_open_fails(hass: HomeAssistant) -> None:
         av_open.assert_called_once()
 
 
+async def test_stream_open_waits_for_slot(hass: HomeAssistant) -> None:
+    """Test the worker does not open the source while all open slots are in use."""
+    stream = Stream(
+        hass,
+        STREAM_SOURCE,
+        {},
+        hass.data[DOMAIN][ATTR_SETTINGS],
+        dynamic_stream_settings(),
+    )
+    stream.add_provider(HLS_PROVIDER)
+    quit_event = threading.Event()
+    source_open_semaphore = threading.BoundedSemaphore(1)
+    start_worker = partial(
+        stream_worker,
+        STREAM_SOURCE,
+        {},
+        hass.data[DOMAIN][ATTR_SETTINGS],
+        StreamState(hass, stream.outputs, stream._diagnostics),
+        KeyFrameConverter(hass, None, dynamic_stream_settings()),
+        quit_event,
+        source_open_semaphore,
+    )
+
+    # The worker gives up waiting for a slot when it is stopped
+    source_open_semaphore.acquire()
+    with patch("av.open") as av_open:
+        worker = hass.async_add_executor_job(start_worker)
+        quit_event.set()
+        await worker
+    av_open.assert_not_called()
+    source_open_semaphore.release()
+
+    # The slot is only held while opening the source
+    quit_event.clear()
+    with patch("av.open") as av_open, pytest.raises(StreamWorkerError):
+        av_open.side_effect = av.error.InvalidDataError(-2, "error")
+        await hass.async_add_executor_job(start_worker)
+    av_open.assert_called_once_with(
+        STREAM_SOURCE, options={}, timeout=(SOURCE_OPEN_TIMEOUT, SOURCE_TIMEOUT)
+    )
+    assert source_open_semaphore.acquire(blocking=False)
+
+
 async def test_stream_worker_success(hass: HomeAssistant) -> None:
     """Test a short stream that ends and outputs everything correctly."""
     decoded_stream = await async_decode_stream(
@@ -958,6 +1010,7 @@ async def test_h265_video_is_hvc1(hass: HomeAssistant, worker_finished_stream) -
     assert stream.get_diagnostics() == {
         "container_format": "mov,mp4,m4a,3gp,3g2,mj2",
         "keepalive": False,
+        "open_time": ANY,
         "orientation": Orientation.NO_TRANSFORM,
         "start_worker": 1,
         "video_codec": "hevc",
@@ -9,9 +9,10 @@ import pytest
 from pytest_unordered import unordered
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import DATA_TRACE_RUNS, DEFAULT_STORED_TRACES
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.core import Context, CoreState, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util.uuid import random_uuid_hex
 
@@ -42,7 +43,13 @@ async def _setup_automation_or_script(
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
-        configs = {config["id"]: {"sequence": config["action"]} for config in configs}
+        configs = {
+            config["id"]: {
+                "sequence": config["action"],
+                **({"trace": config["trace"]} if "trace" in config else {}),
+            }
+            for config in configs
+        }
 
     if script_config:
         if domain == "automation":
@@ -587,6 +594,84 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "num_sun_traces", "num_moon_traces"),
+    [
+        ({"mode": "full"}, 5, 1),
+        ({"mode": "sampled", "sample_interval": 2}, 3, 1),
+        ({"mode": "errors"}, 0, 1),
+        ({"mode": "off"}, 0, 0),
+    ],
+)
+async def test_trace_modes(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain,
+    trace_config,
+    num_sun_traces,
+    num_moon_traces,
+) -> None:
+    """Test which runs are stored for each trace mode."""
+
+    @callback
+    def failing_service(call: ServiceCall) -> None:
+        raise HomeAssistantError("Failed")
+
+    hass.services.async_register("test", "failing", failing_service)
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+        "trace": {"stored_traces": 10, **trace_config},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"service": "test.failing"},
+        "trace": {"stored_traces": 10, **trace_config},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+
+    for _ in range(5):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+    await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == num_sun_traces
+    moon_traces = _find_traces(response["result"], domain, "moon")
+    assert len(moon_traces) == num_moon_traces
+    for trace in moon_traces:
+        assert trace["error"] == "Failed"
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_runs_removed_with_item(hass: HomeAssistant, domain) -> None:
+    """Test the number of sampled runs is forgotten when the item is removed."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+        "trace": {"mode": "sampled", "sample_interval": 2},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config])
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    assert hass.data[DATA_TRACE_RUNS] == {f"{domain}.sun": 1}
+
+    entity = next(
+        entity for entity in hass.data[domain].entities if entity.unique_id == "sun"
+    )
+    await entity.async_remove()
+    assert hass.data[DATA_TRACE_RUNS] == {}
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
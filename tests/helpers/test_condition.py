@@ -264,13 +264,22 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
     config = await condition.async_validate_condition_config(hass, config)
     test = await condition.async_from_config(hass, config)
 
+    # The template condition is checked last and skipped since the
+    # numeric state condition is false
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -306,13 +315,22 @@ async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
     assert config["alias"] == "And Condition Shorthand"
     assert "and" not in config
 
+    # The template condition is checked last and skipped since the
+    # numeric state condition is false
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -348,13 +366,22 @@ async def test_and_condition_list_shorthand(hass: HomeAssistant) -> None:
     assert config["alias"] == "And Condition List Shorthand"
     assert "and" not in config
 
+    # The template condition is checked last and skipped since the
+    # numeric state condition is false
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -377,6 +404,63 @@ async def test_malformed_and_condition_list_shorthand(hass: HomeAssistant) -> No
         cv.CONDITION_SCHEMA(config)
 
 
+async def test_multiple_conditions_check_templates_last(hass: HomeAssistant) -> None:
+    """Test conditions rendering templates are checked after other conditions."""
+    config = {
+        "condition": "or",
+        "conditions": [
+            {
+                "condition": "template",
+                "value_template": "{{ is_state('sensor.temperature', '100') }}",
+            },
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "120",
+            },
+            {
+                "condition": "state",
+                "entity_id": "sensor.unknown",
+                "state": "on",
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 120)
+    assert test(hass)
+    assert_condition_trace(
+        {
+            "": [{"result": {"result": True}}],
+            "conditions/1": [{"result": {"result": True}}],
+            "conditions/1/entity_id/0": [
+                {"result": {"result": True, "state": "120", "wanted_state": "120"}}
+            ],
+        }
+    )
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+    assert list(trace.trace_get(clear=False)) == [
+        "",
+        "conditions/1",
+        "conditions/1/entity_id/0",
+        "conditions/2",
+        "conditions/2/entity_id/0",
+        "conditions/0",
+    ]
+
+    # Errors are reported in the order of the conditions
+    hass.states.async_set("sensor.temperature", 90)
+    config["conditions"][1]["entity_id"] = ["sensor.unknown_2"]
+    test = await condition.async_from_config(hass, config)
+    with pytest.raises(ConditionError) as exc_info:
+        test(hass)
+    assert [error.index for error in exc_info.value.errors] == [1, 2]
+
+
 async def test_or_condition(hass: HomeAssistant) -> None:
     """Test the 'or' condition."""
     config = {
@@ -1,11 +1,18 @@
 """Test the discovery flow helper."""
+import time
+from typing import Any
 from unittest.mock import AsyncMock, call, patch
 
 import pytest
 
 from homeassistant import config_entries
+from homeassistant.components import dhcp
 from homeassistant.core import EVENT_HOMEASSISTANT_STARTED, CoreState, HomeAssistant
+from homeassistant.data_entry_flow import FlowResult, FlowResultType
 from homeassistant.helpers import discovery_flow
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from tests.common import MockConfigEntry, MockModule, mock_integration, mock_platform
 
 
 @pytest.fixture
@@ -113,3 +120,179 @@ async def test_async_create_flow_does_nothing_after_stop(
         {"properties": {"id": "aa:bb:cc:dd:ee:ff"}},
     )
     assert len(mock_flow_init.mock_calls) == 0
+
+
+async def test_async_create_flow_skips_configured_discoveries(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test discoveries that were already configured are not probed again."""
+    hass_storage[discovery_flow.STORAGE_KEY] = {
+        "version": discovery_flow.STORAGE_VERSION,
+        "minor_version": 1,
+        "key": discovery_flow.STORAGE_KEY,
+        "data": {
+            "hue": {
+                discovery_flow._async_discovery_fingerprint(
+                    config_entries.SOURCE_ZEROCONF, {"properties": {"id": "expired"}}
+                ): time.time() - 1
+            }
+        },
+    }
+    entry = MockConfigEntry(domain="hue", unique_id="aabbccddeeff")
+    entry.add_to_hass(hass)
+    hass.set_state(CoreState.stopped)
+    with patch.object(
+        hass.config_entries.flow,
+        "async_init",
+        return_value={"type": FlowResultType.ABORT, "reason": "already_configured"},
+    ) as mock_init, patch.object(discovery_flow, "CACHE_SAVE_DELAY", 0):
+        discovery_flow.async_create_flow(
+            hass,
+            "hue",
+            {"source": config_entries.SOURCE_ZEROCONF},
+            {"properties": {"id": "aa:bb:cc:dd:ee:ff"}},
+        )
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 1
+
+        discovery_flow.async_create_flow(
+            hass,
+            "hue",
+            {"source": config_entries.SOURCE_ZEROCONF},
+            {"properties": {"id": "aa:bb:cc:dd:ee:ff"}},
+        )
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 1
+
+        # Expired discoveries are not stored
+        stored = hass_storage[discovery_flow.STORAGE_KEY]["data"]
+        assert stored == {
+            "hue": {
+                discovery_flow._async_discovery_fingerprint(
+                    config_entries.SOURCE_ZEROCONF,
+                    {"properties": {"id": "aa:bb:cc:dd:ee:ff"}},
+                ): pytest.approx(time.time() + discovery_flow.CACHE_TTL, abs=60)
+            }
+        }
+
+        # Other sources, changed and expired discovery data are probed again
+        for source, device_id in (
+            (config_entries.SOURCE_DHCP, "aa:bb:cc:dd:ee:ff"),
+            (config_entries.SOURCE_ZEROCONF, "11:22:33:44:55:66"),
+            (config_entries.SOURCE_ZEROCONF, "expired"),
+        ):
+            discovery_flow.async_create_flow(
+                hass,
+                "hue",
+                {"source": source},
+                {"properties": {"id": device_id}},
+            )
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 4
+
+        # Entry state changes do not probe discoveries again
+        async_dispatcher_send(
+            hass,
+            config_entries.SIGNAL_CONFIG_ENTRY_CHANGED,
+            config_entries.ConfigEntryChange.UPDATED,
+            entry,
+        )
+        discovery_flow.async_create_flow(
+            hass,
+            "hue",
+            {"source": config_entries.SOURCE_ZEROCONF},
+            {"properties": {"id": "aa:bb:cc:dd:ee:ff"}},
+        )
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 4
+
+        # Updating the data of an entry of the domain probes its discoveries
+        # again, a device moving back to a previous host updates the entry
+        hass.config_entries.async_update_entry(entry, data={"host": "1.2.3.4"})
+        discovery_flow.async_create_flow(
+            hass,
+            "hue",
+            {"source": config_entries.SOURCE_ZEROCONF},
+            {"properties": {"id": "aa:bb:cc:dd:ee:ff"}},
+        )
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 5
+
+        # Removing an entry of the domain probes its discoveries again
+        async_dispatcher_send(
+            hass,
+            config_entries.SIGNAL_CONFIG_ENTRY_CHANGED,
+            config_entries.ConfigEntryChange.REMOVED,
+            MockConfigEntry(domain="hue"),
+        )
+        discovery_flow.async_create_flow(
+            hass,
+            "hue",
+            {"source": config_entries.SOURCE_ZEROCONF},
+            {"properties": {"id": "aa:bb:cc:dd:ee:ff"}},
+        )
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 6
+
+
+async def test_async_create_flow_reloads_entry_in_setup_retry(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test discovering a configured device again reloads its entry in setup retry."""
+    hass.config.components.add("comp")
+    entry = MockConfigEntry(
+        domain="comp",
+        unique_id="aa:bb:cc:dd:ee:ff",
+        state=config_entries.ConfigEntryState.LOADED,
+    )
+    entry.add_to_hass(hass)
+    mock_integration(hass, MockModule("comp"))
+    mock_platform(hass, "comp.config_flow", None)
+
+    class TestFlow(config_entries.ConfigFlow):
+        """Test flow."""
+
+        VERSION = 1
+
+        async def async_step_dhcp(
+            self, discovery_info: dhcp.DhcpServiceInfo
+        ) -> FlowResult:
+            """Test dhcp step."""
+            await self.async_set_unique_id(discovery_info.macaddress)
+            self._abort_if_unique_id_configured()
+
+    discovery_info = dhcp.DhcpServiceInfo(
+        hostname="any", ip="1.2.3.4", macaddress="aa:bb:cc:dd:ee:ff"
+    )
+    hass.set_state(CoreState.stopped)
+    with patch.dict(config_entries.HANDLERS, {"comp": TestFlow}), patch.object(
+        hass.config_entries.flow,
+        "async_init",
+        side_effect=hass.config_entries.flow.async_init,
+    ) as mock_init, patch(
+        "homeassistant.config_entries.ConfigEntries.async_reload"
+    ) as async_reload:
+        discovery_flow.async_create_flow(
+            hass, "comp", {"source": config_entries.SOURCE_DHCP}, discovery_info
+        )
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 1
+
+        # The loaded entry is not probed again
+        discovery_flow.async_create_flow(
+            hass, "comp", {"source": config_entries.SOURCE_DHCP}, discovery_info
+        )
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 1
+        assert len(async_reload.mock_calls) == 0
+
+        # The discovery reloads the entry while it retries its setup
+        entry.mock_state(hass, config_entries.ConfigEntryState.SETUP_RETRY)
+        discovery_flow.async_create_flow(
+            hass, "comp", {"source": config_entries.SOURCE_DHCP}, discovery_info
+        )
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 2
+        assert len(async_reload.mock_calls) == 1
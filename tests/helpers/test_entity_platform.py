@@ -1,7 +1,8 @@
 """Tests for the EntityPlatform helper."""
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Coroutine, Iterable
 from datetime import timedelta
+import inspect
 import logging
 from typing import Any
 from unittest.mock import ANY, Mock, patch
@@ -550,6 +551,38 @@ async def test_raise_error_on_update(hass: HomeAssistant) -> None:
     assert entity2.platform is not None
 
 
+async def test_adding_entities_without_update_does_not_create_tasks(
+    hass: HomeAssistant,
+) -> None:
+    """Test adding entities without update_before_add does not create a task each."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({})
+    entities = [MockEntity(name=f"test_{idx}") for idx in range(50)]
+
+    with patch("asyncio.gather", wraps=asyncio.gather) as mock_gather:
+        await component.async_add_entities(entities)
+
+    assert mock_gather.call_count == 0
+    assert len(hass.states.async_entity_ids()) == 50
+
+
+async def test_adding_entities_without_update_continues_after_error(
+    hass: HomeAssistant,
+) -> None:
+    """Test an invalid entity does not prevent the remaining ones from being added."""
+    platform = MockEntityPlatform(hass)
+    entity1 = MockEntity(name="test_1")
+    entity2 = MockEntity(entity_id="invalid_entity_id")
+    entity3 = MockEntity(name="test_3")
+
+    with pytest.raises(HomeAssistantError):
+        await platform.async_add_entities([entity1, entity2, entity3])
+
+    assert entity2.hass is None
+    assert hass.states.get("test_domain.test_1") is not None
+    assert hass.states.get("test_domain.test_3") is not None
+
+
 async def test_async_remove_with_platform(hass: HomeAssistant) -> None:
     """Remove an entity from a platform."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -1761,6 +1794,33 @@ async def test_setup_entry_with_entities_that_block_forever(
     assert "test" in caplog.text
 
 
+async def test_adding_entities_closes_remaining_coros_on_timeout(
+    hass: HomeAssistant,
+) -> None:
+    """Test entities not added before the timeout do not leave unawaited coros."""
+    platform = MockEntityPlatform(hass)
+    entities = [
+        MockBlockingEntity(name="test1", unique_id="unique1"),
+        MockEntity(name="test2"),
+        MockEntity(name="test3"),
+    ]
+    coros: list[Coroutine[Any, Any, None]] = []
+    async_add_entity = platform._async_add_entity
+
+    def _async_add_entity(*args: Any) -> Coroutine[Any, Any, None]:
+        coros.append(async_add_entity(*args))
+        return coros[-1]
+
+    with patch.object(entity_platform, "SLOW_ADD_ENTITY_MAX_WAIT", 0.01), patch.object(
+        entity_platform, "SLOW_ADD_MIN_TIMEOUT", 0.01
+    ), patch.object(platform, "_async_add_entity", _async_add_entity):
+        await platform.async_add_entities(entities)
+
+    assert len(coros) == 3
+    assert all(inspect.getcoroutinestate(coro) == inspect.CORO_CLOSED for coro in coros)
+    assert len(hass.states.async_entity_ids()) == 0
+
+
 async def test_two_platforms_add_same_entity(hass: HomeAssistant) -> None:
     """Test two platforms in the same domain adding an entity with the same name."""
     entity_platform1 = MockEntityPlatform(
@@ -4,6 +4,8 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+import functools as ft
+import math
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -13,7 +15,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
@@ -25,6 +27,8 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_call_later_coarse,
+    async_get_coarse_timers_by_owner,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -4422,6 +4426,107 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_async_call_later_coarse(hass: HomeAssistant) -> None:
+    """Test coarse timers in the same tick share a loop timer."""
+    calls: list[tuple[str, datetime]] = []
+    loop = hass.loop
+
+    def _scheduled() -> int:
+        return sum(
+            1
+            for handle in loop._scheduled
+            if not handle.cancelled()
+            and handle._callback.__name__ == "_async_run_bucket"
+        )
+
+    now = dt_util.utcnow()
+    start = loop.time()
+    # Seconds until the end of the tick five ticks from now
+    delay = math.ceil(start) + 5 - start
+    for name, job_delay in (
+        ("first", delay - 0.75),
+        ("second", timedelta(seconds=delay - 0.5)),
+        ("third", delay - 0.25),
+        ("later", delay + 0.5),
+    ):
+        async_call_later_coarse(
+            hass,
+            job_delay,
+            ft.partial(lambda name, now: calls.append((name, now)), name),
+            name=name,
+        )
+    cancelled = async_call_later_coarse(
+        hass, delay + 1.5, lambda _: calls.append("cancelled"), name="cancelled"
+    )
+    assert _scheduled() == 3
+    assert async_get_coarse_timers_by_owner(hass) == {
+        "first": 1,
+        "second": 1,
+        "third": 1,
+        "later": 1,
+        "cancelled": 1,
+    }
+
+    cancelled()
+    cancelled()
+    assert _scheduled() == 2
+    assert "cancelled" not in async_get_coarse_timers_by_owner(hass)
+
+    async_fire_time_changed_exact(hass, now + timedelta(seconds=delay - 0.5))
+    assert calls == []
+
+    fire_time = now + timedelta(seconds=delay + 0.1)
+    async_fire_time_changed_exact(hass, fire_time)
+    assert calls == [("first", fire_time), ("second", fire_time), ("third", fire_time)]
+    assert async_get_coarse_timers_by_owner(hass) == {"later": 1}
+
+    async_fire_time_changed_exact(hass, now + timedelta(seconds=delay + 3))
+    assert [name for name, _ in calls] == ["first", "second", "third", "later"]
+    assert async_get_coarse_timers_by_owner(hass) == {}
+    assert _scheduled() == 0
+
+
+async def test_async_get_coarse_timers_by_owner(hass: HomeAssistant) -> None:
+    """Test pending coarse timers are counted by owner."""
+    assert async_get_coarse_timers_by_owner(hass) == {}
+
+    calls = []
+    unsubs = [
+        async_call_later_coarse(hass, delay, calls.append, name="mqtt")
+        for delay in (1, 1, 30)
+    ]
+    async_call_later_coarse(hass, 5, calls.append, name="other")
+    assert async_get_coarse_timers_by_owner(hass) == {"mqtt": 3, "other": 1}
+
+    unsubs[0]()
+    assert async_get_coarse_timers_by_owner(hass) == {"mqtt": 2, "other": 1}
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert async_get_coarse_timers_by_owner(hass) == {"mqtt": 1}
+
+    unsubs[2]()
+    assert async_get_coarse_timers_by_owner(hass) == {}
+
+
+async def test_async_call_later_coarse_cancelled_at_stop(
+    hass: HomeAssistant,
+) -> None:
+    """Test coarse timers are cancelled when Home Assistant stops."""
+    calls = []
+    async_call_later_coarse(hass, 5, calls.append, name="stopped")
+    assert async_get_coarse_timers_by_owner(hass) == {"stopped": 1}
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert async_get_coarse_timers_by_owner(hass) == {}
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert calls == []
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
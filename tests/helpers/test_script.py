@@ -178,6 +178,35 @@ async def test_firing_event_basic(
     )
 
 
+async def test_step_handlers(hass: HomeAssistant) -> None:
+    """Test the step handlers are resolved when the script is created."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": "test_event", "event_data": {"step": "outer"}},
+            {
+                "if": {"condition": "template", "value_template": "{{ true }}"},
+                "then": {"event": "test_event", "event_data": {"step": "nested"}},
+            },
+        ]
+    )
+
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    assert script_obj.step_handlers == [
+        (cv.SCRIPT_ACTION_FIRE_EVENT, "_async_event_step"),
+        (cv.SCRIPT_ACTION_IF, "_async_if_step"),
+    ]
+
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    # The nested script runs its steps with its own handlers
+    assert [event.data["step"] for event in events] == ["outer", "nested"]
+
+    with pytest.raises(ValueError, match="Unable to determine action"):
+        script.Script(hass, [{"unknown_action": None}], "Test Name", "test_domain")
+
+
 async def test_firing_event_template(hass: HomeAssistant) -> None:
     """Test the firing of events."""
     event = "test_event"
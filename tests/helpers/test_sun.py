@@ -1,6 +1,7 @@
 """The tests for the Sun helpers."""
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from freezegun import freeze_time
 import pytest
@@ -206,3 +207,38 @@ def test_impossible_elevation(hass: HomeAssistant) -> None:
 
     with pytest.raises(ValueError):
         sun.get_astral_event_next(hass, SUN_EVENT_SUNRISE, june)
+
+
+def test_events_are_cached(hass: HomeAssistant) -> None:
+    """Test sun events are only calculated once for a location and date."""
+    utc_now = datetime(2016, 11, 1, 8, 0, 0, tzinfo=dt_util.UTC)
+    location, elevation = sun.get_astral_location(hass)
+    assert sun.DATA_ASTRAL_EVENT_CACHE not in hass.data
+
+    with patch.object(
+        type(location), "sunset", autospec=True, side_effect=type(location).sunset
+    ) as mock_sunset:
+        next_setting = sun.get_astral_event_next(hass, SUN_EVENT_SUNSET, utc_now)
+        calculated = mock_sunset.call_count
+        assert calculated
+        assert (
+            sun.get_astral_event_next(hass, SUN_EVENT_SUNSET, utc_now) == next_setting
+        )
+        assert (
+            sun.get_astral_event_date(hass, SUN_EVENT_SUNSET, utc_now) == next_setting
+        )
+        assert mock_sunset.call_count == calculated
+        assert len(hass.data[sun.DATA_ASTRAL_EVENT_CACHE])
+
+        # A different elevation is a different event
+        hass.config.elevation = elevation + 1000
+        assert (
+            sun.get_astral_event_next(hass, SUN_EVENT_SUNSET, utc_now) != next_setting
+        )
+        assert mock_sunset.call_count > calculated
+
+    # The solar depression changes the time of dusk
+    location.solar_depression = "civil"
+    civil_dusk = sun.get_astral_event_date(hass, "dusk", utc_now)
+    location.solar_depression = "nautical"
+    assert sun.get_astral_event_date(hass, "dusk", utc_now) > civil_dusk
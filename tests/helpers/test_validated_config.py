@@ -0,0 +1,50 @@
+"""Test the validated config helper."""
+from unittest.mock import AsyncMock
+
+from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.validated_config import ValidatedConfigCache
+
+
+class MockValidatedConfig(dict):
+    """Mock validated config."""
+
+    validation_failed: bool = False
+
+
+async def test_validated_config_cache(hass: HomeAssistant) -> None:
+    """Test validated configs are reused until they are dropped."""
+    valid_config = MockValidatedConfig()
+    failed_config = MockValidatedConfig()
+    failed_config.validation_failed = True
+
+    cache: ValidatedConfigCache[MockValidatedConfig] = ValidatedConfigCache(
+        hass, "test"
+    )
+    validate_valid = AsyncMock(return_value=valid_config)
+    validate_failed = AsyncMock(return_value=failed_config)
+    assert await cache.async_get_or_validate({"a": 1}, validate_valid) is valid_config
+    assert await cache.async_get_or_validate({"b": 1}, validate_failed) is failed_config
+    cache.async_store()
+
+    # Only configs which passed validation are reused
+    cache = ValidatedConfigCache(hass, "test")
+    assert await cache.async_get_or_validate({"a": 1}, validate_valid) is valid_config
+    assert await cache.async_get_or_validate({"b": 1}, validate_failed) is failed_config
+    assert validate_valid.await_count == 1
+    assert validate_failed.await_count == 2
+
+    # Configs of other domains are not reused
+    other_cache: ValidatedConfigCache[MockValidatedConfig] = ValidatedConfigCache(
+        hass, "other"
+    )
+    await other_cache.async_get_or_validate({"a": 1}, validate_valid)
+    assert validate_valid.await_count == 2
+
+    # Configs are not stored if they were dropped while validating
+    async_dispatcher_send(hass, SIGNAL_CONFIG_ENTRY_CHANGED)
+    cache.async_store()
+    cache = ValidatedConfigCache(hass, "test")
+    await cache.async_get_or_validate({"a": 1}, validate_valid)
+    assert validate_valid.await_count == 3